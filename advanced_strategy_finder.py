@@ -3,99 +3,154 @@ Advanced strategy finder with parameter optimization
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import logging
 
-from src.optimization.strategy_optimizer import get_strategy_optimizer
-from datetime import datetime, timedelta
+from src.optimization.strategy_optimizer import get_strategy_optimizer, StrategyPerformance, performance_records
+from src.backtesting.engine import BacktestEngine
+from src.trading.strategies import STRATEGIES
+from src.utils.logger import setup_logger
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import attrgetter
+import heapq
+import numpy as np
 import pandas as pd
 
+# Report logger; LOG_LEVEL=WARNING silences the per-parameter details
+logger = setup_logger("advanced_strategy_finder")
+
+# Test periods as (start, end, label); dates are parsed once here and only
+# formatted back to strings at the data provider boundary
+PERIODS = [
+    (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-03-01"), "Q1 2025 (Jan-Mar)"),
+    (pd.Timestamp("2025-03-01"), pd.Timestamp("2025-06-01"), "Q2 2025 (Mar-Jun)"),
+    (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-06-01"), "H1 2025 (Jan-Jun)"),
+    (pd.Timestamp("2024-10-01"), pd.Timestamp("2025-01-01"), "Q4 2024 (Oct-Dec)"),
+]
+
+def _slice_period(data, start_date, end_date):
+    """Slice a preloaded, date-sorted OHLCV frame to [start_date, end_date)"""
+    tz = data['date'].dt.tz
+    lo = data['date'].searchsorted(start_date.tz_localize(tz))
+    hi = data['date'].searchsorted(end_date.tz_localize(tz))
+    return data.iloc[lo:hi].reset_index(drop=True)
+
+def _run_one(task):
+    """Backtest a single (group, strategy) task in a worker process"""
+    group, strategy_name, symbol, start_date, end_date, historical_data = task
+    engine = BacktestEngine(initial_capital=100000)
+    result = engine.run_backtest_on_data(historical_data, strategy_name, symbol, start_date, end_date)
+    return StrategyPerformance.from_backtest(strategy_name, result)
+
+# Worker pool shared by every analysis in this script
+_executor = None
+
+def get_executor():
+    """Get the shared process pool, starting its workers on first use"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+def _run_parallel(tasks):
+    """Run backtest tasks across all cores and group the results by task group"""
+    grouped = {task[0]: [] for task in tasks}
+    
+    executor = get_executor()
+    futures = {executor.submit(_run_one, task): task for task in tasks}
+    for future in as_completed(futures):
+        group, strategy_name = futures[future][:2]
+        try:
+            grouped[group].append(future.result())
+        except Exception as e:
+            print(f"Error: {strategy_name} ({group}) failed - {e}")
+    
+    return grouped
+
 def test_multiple_periods():
     """Test strategies across multiple time periods"""
     
-    print("ADVANCED STRATEGY ANALYSIS FOR RELIANCE")
-    print("=" * 50)
+    # Flush the header before the long-running backtests
+    sys.stdout.write("ADVANCED STRATEGY ANALYSIS FOR RELIANCE\n" + "=" * 50 + "\n")
+    sys.stdout.flush()
     
     optimizer = get_strategy_optimizer()
     
-    # Define multiple test periods
-    periods = [
-        ("2025-01-01", "2025-03-01", "Q1 2025 (Jan-Mar)"),
-        ("2025-03-01", "2025-06-01", "Q2 2025 (Mar-Jun)"),
-        ("2025-01-01", "2025-06-01", "H1 2025 (Jan-Jun)"),
-        ("2024-10-01", "2025-01-01", "Q4 2024 (Oct-Dec)"),
-    ]
+    periods = PERIODS
+    
+    # Fetch the union of all periods once and slice it per period
+    union_start = min(start for start, _, _ in periods)
+    union_end = max(end for _, end, _ in periods)
+    full_data = optimizer.data_provider.get_historical_data(
+        "RELIANCE", union_start.strftime("%Y-%m-%d"), union_end.strftime("%Y-%m-%d")
+    )
+    
+    # Backtest every (period, strategy) pair in parallel
+    tasks = []
+    for start_date, end_date, period_name in periods:
+        period_data = _slice_period(full_data, start_date, end_date) if not full_data.empty else full_data
+        start_str, end_str = start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+        tasks.extend(
+            (period_name, strategy_name, "RELIANCE", start_str, end_str, period_data)
+            for strategy_name in STRATEGIES
+        )
+    
+    period_results = _run_parallel(tasks)
     
     all_results = {}
+    out = []
     
     for start_date, end_date, period_name in periods:
-        print(f"\nTesting period: {period_name}")
-        print("-" * 30)
+        out.append(f"\nTesting period: {period_name}")
+        out.append("-" * 30)
         
-        try:
-            results = optimizer.optimize_strategies(
-                symbol="RELIANCE",
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            if results:
-                best = results[0]
-                print(f"Best: {best.strategy_name} ({best.total_return_percent:.2f}%)")
-                all_results[period_name] = {
-                    'best_strategy': best.strategy_name,
-                    'return_pct': best.total_return_percent,
-                    'trades': best.total_trades,
-                    'win_rate': best.win_rate
-                }
-            else:
-                print("No valid results")
-                all_results[period_name] = None
-                
-        except Exception as e:
-            print(f"Error: {e}")
+        results = period_results[period_name]
+        
+        if results:
+            best = max(results, key=attrgetter('total_return_percent'))
+            out.append(f"Best: {best.strategy_name} ({best.total_return_percent:.2f}%)")
+            all_results[period_name] = {
+                'best_strategy': best.strategy_name,
+                'return_pct': best.total_return_percent,
+                'trades': best.total_trades,
+                'win_rate': best.win_rate
+            }
+        else:
+            out.append("No valid results")
             all_results[period_name] = None
     
     # Summary analysis
-    print("\n" + "=" * 50)
-    print("SUMMARY ACROSS ALL PERIODS")
-    print("=" * 50)
+    out += [
+        "\n" + "=" * 50,
+        "SUMMARY ACROSS ALL PERIODS",
+        "=" * 50,
+    ]
+    
+    df = pd.DataFrame([{**data, 'period': period} for period, data in all_results.items() if data])
     
-    strategy_performance = {}
-    
-    for period, data in all_results.items():
-        if data:
-            strategy = data['best_strategy']
-            if strategy not in strategy_performance:
-                strategy_performance[strategy] = []
-            strategy_performance[strategy].append({
-                'period': period,
-                'return': data['return_pct'],
-                'trades': data['trades'],
-                'win_rate': data['win_rate']
-            })
-    
-    print("\nStrategy consistency across periods:")
-    for strategy, performances in strategy_performance.items():
-        avg_return = sum(p['return'] for p in performances) / len(performances)
-        periods_won = len(performances)
-        print(f"{strategy.upper()}: Won {periods_won} periods, Avg return: {avg_return:.2f}%")
-    
-    # Find most consistent strategy
-    if strategy_performance:
-        most_consistent = max(strategy_performance.items(), 
-                            key=lambda x: len(x[1]))
+    out.append("\nStrategy consistency across periods:")
+    if not df.empty:
+        df['best_strategy'] = df['best_strategy'].astype('category')
+        summary = df.groupby('best_strategy', sort=False, observed=True).agg(
+            avg_return=('return_pct', 'mean'),
+            periods_won=('period', 'count')
+        )
+        out.extend(
+            f"{row.Index.upper()}: Won {row.periods_won} periods, Avg return: {row.avg_return:.2f}%"
+            for row in summary.itertuples()
+        )
         
-        print(f"\nMOST CONSISTENT STRATEGY: {most_consistent[0].upper()}")
-        print(f"Won {len(most_consistent[1])} out of {len([r for r in all_results.values() if r])} periods")
+        # Find most consistent strategy
+        most_consistent = summary['periods_won'].idxmax()
+        
+        out.append(f"\nMOST CONSISTENT STRATEGY: {most_consistent.upper()}")
+        out.append(f"Won {summary.at[most_consistent, 'periods_won']} out of {len(df)} periods")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def test_different_parameters():
     """Test the best strategy with different parameters"""
     
-    print("\n" + "=" * 50)
-    print("PARAMETER OPTIMIZATION FOR MACD STRATEGY")
-    print("=" * 50)
-    
-    optimizer = get_strategy_optimizer()
+    sys.stdout.write("\n" + "=" * 50 + "\nPARAMETER OPTIMIZATION FOR MACD STRATEGY\n" + "=" * 50 + "\n")
     
     # Test different stop-loss and target combinations
     param_combinations = [
@@ -105,80 +160,128 @@ def test_different_parameters():
         (0.02, 0.04, "Very Conservative (2% SL, 4% Target)"),
     ]
     
-    print("Testing MACD with different risk parameters:")
-    print()
+    # Flush the header before the sweep; the per-pair details go through the report logger
+    sys.stdout.write("Testing MACD with different risk parameters:\n\n")
+    sys.stdout.flush()
     
-    best_params = None
-    best_return = float('-inf')
+    # One engine and one data load shared by every parameter pair
+    engine = BacktestEngine(initial_capital=100000)
+    historical_data = engine.data_provider.get_historical_data("RELIANCE", "2025-01-01", "2025-06-01")
     
-    for stop_loss, target, description in param_combinations:
-        try:
-            # Create a custom backtest engine for this test
-            from src.backtesting.engine import BacktestEngine
-            engine = BacktestEngine(initial_capital=100000)
-            
-            result = engine.run_backtest(
-                strategy_name="macd",
-                symbol="RELIANCE",
-                start_date="2025-01-01",
-                end_date="2025-06-01",
-                stop_loss_percent=stop_loss,
-                target_percent=target
+    # Signals are generated once and reused for every parameter pair
+    sweep = engine.run_parameter_sweep(
+        strategy_name="macd",
+        symbol="RELIANCE",
+        start_date="2025-01-01",
+        end_date="2025-06-01",
+        param_combinations=[(stop_loss, target) for stop_loss, target, _ in param_combinations],
+        historical_data=historical_data
+    )
+    
+    # Float formatting is deferred to the logging module and skipped entirely
+    # when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        for stop_loss, target, description in param_combinations:
+            result = sweep[(stop_loss, target)]
+            logger.info(
+                "%s\n  Return: %.2f%%\n  Trades: %d\n  Win Rate: %.1f%%\n  Max Drawdown: %.2f%%\n",
+                description, result.total_return_percent, result.total_trades,
+                result.win_rate, result.max_drawdown
             )
-            
-            print(f"{description}")
-            print(f"  Return: {result.total_return_percent:.2f}%")
-            print(f"  Trades: {result.total_trades}")
-            print(f"  Win Rate: {result.win_rate:.1f}%")
-            print(f"  Max Drawdown: {result.max_drawdown:.2f}%")
-            print()
-            
-            if result.total_return_percent > best_return:
-                best_return = result.total_return_percent
-                best_params = (stop_loss, target, description)
-                
-        except Exception as e:
-            print(f"{description}: Error - {e}")
-            print()
     
-    if best_params:
-        print(f"BEST PARAMETERS: {best_params[2]}")
-        print(f"Return: {best_return:.2f}%")
+    if sweep:
+        best_stop_loss, best_target, best_description = max(
+            param_combinations,
+            key=lambda p: sweep[(p[0], p[1])].total_return_percent
+        )
+        sys.stdout.write(
+            f"BEST PARAMETERS: {best_description}\n"
+            f"Return: {sweep[(best_stop_loss, best_target)].total_return_percent:.2f}%\n"
+        )
 
-def quick_comparison():
-    """Quick comparison of top strategies"""
+def test_parameter_grid(sl_grid=None, tp_grid=None):
+    """Sweep MACD over a full stop-loss x target grid"""
+    
+    if sl_grid is None:
+        sl_grid = np.linspace(0.01, 0.10, 10)
+    if tp_grid is None:
+        tp_grid = np.linspace(0.02, 0.20, 10)
     
     print("\n" + "=" * 50)
-    print("QUICK STRATEGY COMPARISON")
+    print("PARAMETER GRID FOR MACD STRATEGY")
     print("=" * 50)
     
-    optimizer = get_strategy_optimizer()
+    # Every (stop_loss, target) cell of the grid, row-major over stop-loss
+    sl_mesh, tp_mesh = np.meshgrid(sl_grid, tp_grid, indexing="ij")
+    grid = pd.MultiIndex.from_arrays([sl_mesh.ravel(), tp_mesh.ravel()], names=["stop_loss", "target"])
     
-    # Test just the top 3 strategies
-    top_strategies = ["macd", "supertrend", "rsi"]
-    
-    results = optimizer.optimize_strategies(
+    engine = BacktestEngine(initial_capital=100000)
+    historical_data = engine.data_provider.get_historical_data("RELIANCE", "2025-01-01", "2025-06-01")
+    sweep = engine.run_parameter_sweep(
+        strategy_name="macd",
         symbol="RELIANCE",
         start_date="2025-01-01",
         end_date="2025-06-01",
-        strategies=top_strategies
+        param_combinations=list(grid),
+        historical_data=historical_data
     )
     
-    print("Top 3 strategies comparison:")
-    print()
+    returns = np.fromiter((sweep[cell].total_return_percent for cell in grid), dtype=np.float64, count=len(grid))
+    table = pd.Series(returns, index=grid).unstack("target")
+    table.index = [f"SL {sl:.1%}" for sl in table.index]
+    table.columns = [f"TP {tp:.1%}" for tp in table.columns]
+    
+    best_sl, best_tp = np.unravel_index(returns.argmax(), sl_mesh.shape)
+    print("Return % by stop-loss (rows) and target (columns):")
+    print(table.round(2).to_string())
+    print(f"\nBEST GRID CELL: {sl_grid[best_sl]:.1%} SL, {tp_grid[best_tp]:.1%} Target")
+    print(f"Return: {returns.max():.2f}%")
+    return table
+
+def quick_comparison():
+    """Quick comparison of top strategies"""
+    
+    # Flush the header before the long-running backtests
+    sys.stdout.write("\n" + "=" * 50 + "\nQUICK STRATEGY COMPARISON\n" + "=" * 50 + "\n")
+    sys.stdout.flush()
+    
+    optimizer = get_strategy_optimizer()
+    
+    # Test just the top 3 strategies
+    top_strategies = ["macd", "supertrend", "rsi"]
+    
+    historical_data = optimizer.data_provider.get_historical_data("RELIANCE", "2025-01-01", "2025-06-01")
+    results = _run_parallel([
+        ("top", strategy_name, "RELIANCE", "2025-01-01", "2025-06-01", historical_data)
+        for strategy_name in top_strategies
+    ])["top"]
+    results = heapq.nlargest(3, results, key=attrgetter('total_return_percent'))
+    
+    # Format whole columns at once instead of per-object attribute access
+    records = performance_records(results)
+    names = np.char.upper(records.name)
+    returns = np.char.mod("%.2f", records.ret)
+    sharpes = np.char.mod("%.2f", records.sharpe)
+    win_rates = np.char.mod("%.1f", records.win)
     
-    for i, result in enumerate(results, 1):
-        print(f"{i}. {result.strategy_name.upper()}")
-        print(f"   Return: {result.total_return_percent:.2f}%")
-        print(f"   Risk-Adjusted (Sharpe): {result.sharpe_ratio:.2f}")
-        print(f"   Consistency (Win Rate): {result.win_rate:.1f}%")
-        print()
+    sys.stdout.write("Top 3 strategies comparison:\n\n" + "".join(
+        f"{i}. {name}\n"
+        f"   Return: {ret}%\n"
+        f"   Risk-Adjusted (Sharpe): {sharpe}\n"
+        f"   Consistency (Win Rate): {win}%\n\n"
+        for i, (name, ret, sharpe, win) in enumerate(zip(names, returns, sharpes, win_rates), 1)
+    ))
 
 if __name__ == "__main__":
     # Run comprehensive analysis
-    test_multiple_periods()
-    test_different_parameters()
-    quick_comparison()
+    try:
+        test_multiple_periods()
+        test_different_parameters()
+        test_parameter_grid()
+        quick_comparison()
+    finally:
+        if _executor is not None:
+            _executor.shutdown()
     
     print("\n" + "=" * 50)
     print("FINAL RECOMMENDATION")
@@ -7,6 +7,7 @@ import logging
 from dotenv import load_dotenv
 from flask import Flask
 from src.dashboard import create_dashboard
+from src.backtesting import warm_up_kernels
 from src.trading.bot import TradeBot
 from src.utils.logger import setup_logger
 
@@ -21,6 +22,9 @@ def main():
     """Main application entry point"""
     logger.info("Starting ZeroBot Trading Application")
     
+    # Compile the backtest kernels before the first dashboard request needs them
+    warm_up_kernels()
+    
     # Initialize the trading bot
     trade_bot = TradeBot()
     
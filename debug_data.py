@@ -1,10 +1,6 @@
 """
 Debug script to check data columns
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.data.providers import YFinanceProvider
 from datetime import datetime, timedelta
 
@@ -1,10 +1,6 @@
 """
 Debug script to check strategy
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.data.providers import YFinanceProvider
 from src.trading.strategies import STRATEGIES
 from datetime import datetime, timedelta
@@ -34,15 +30,17 @@ def debug_strategy():
             print(f"Signal data shape: {signals.shape}")
             
             # Check for buy/sell signals
-            buy_signals = signals[signals['position'] == 1]
-            sell_signals = signals[signals['position'] == -1]
-            
-            print(f"Buy signals: {len(buy_signals)}")
-            print(f"Sell signals: {len(sell_signals)}")
-            
-            if len(buy_signals) > 0:
+            position = signals['position'].to_numpy()
+            buy_mask = position == 1
+            buy_count = int(buy_mask.sum())
+            sell_count = int((position == -1).sum())
+
+            print(f"Buy signals: {buy_count}")
+            print(f"Sell signals: {sell_count}")
+
+            if buy_count > 0:
                 print("\nFirst few buy signals:")
-                print(buy_signals[['date', 'close', 'short_ma', 'long_ma', 'position']].head())
+                print(signals.loc[buy_mask, ['date', 'close', 'short_ma', 'long_ma', 'position']].head())
                 
         except Exception as e:
             print(f"Strategy failed: {e}")
@@ -2,8 +2,6 @@
 Quick strategy optimization for RELIANCE - simplified version
 """
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.optimization.strategy_optimizer import get_strategy_optimizer
 
@@ -21,21 +19,26 @@ def quick_test():
         end_date="2025-06-01"
     )
     
-    print(f"Tested {len(results)} strategies:")
-    print()
+    out = [f"Tested {len(results)} strategies:", ""]
     
     for i, result in enumerate(results, 1):
         status = "PROFIT" if result.total_return_percent > 0 else "LOSS"
-        print(f"{i}. {result.strategy_name.upper()}")
-        print(f"   Return: {result.total_return_percent:.2f}% ({status})")
-        print(f"   Trades: {result.total_trades}, Win Rate: {result.win_rate:.1f}%")
-        print(f"   Sharpe: {result.sharpe_ratio:.2f}")
-        print()
+        out += [
+            f"{i}. {result.strategy_name.upper()}",
+            f"   Return: {result.total_return_percent:.2f}% ({status})",
+            f"   Trades: {result.total_trades}, Win Rate: {result.win_rate:.1f}%",
+            f"   Sharpe: {result.sharpe_ratio:.2f}",
+            "",
+        ]
     
     best = results[0]
-    print("WINNER: " + best.strategy_name.upper())
-    print(f"Best return: {best.total_return_percent:.2f}%")
-    print(f"Final capital: Rs {best.final_capital:,.0f}")
+    out += [
+        "WINNER: " + best.strategy_name.upper(),
+        f"Best return: {best.total_return_percent:.2f}%",
+        f"Final capital: Rs {best.final_capital:,.0f}",
+    ]
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     quick_test()
@@ -1,6 +1,6 @@
 """
 Backtesting module for trading strategies
 """
-from .engine import BacktestEngine, BacktestResults, BacktestTrade, get_backtest_engine
+from .engine import BacktestEngine, BacktestResults, BacktestTrade, PreparedRun, TradeArray, get_backtest_engine, warm_up_kernels
 
-__all__ = ['BacktestEngine', 'BacktestResults', 'BacktestTrade', 'get_backtest_engine']
+__all__ = ['BacktestEngine', 'BacktestResults', 'BacktestTrade', 'PreparedRun', 'TradeArray', 'get_backtest_engine', 'warm_up_kernels']
@@ -1,17 +1,37 @@
 """
 Backtesting engine for trading strategies
 """
+import os
 import logging
+import hashlib
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from src.data.providers import get_data_provider
 from src.trading.strategies import STRATEGIES
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+# Exit reasons as returned by the simulation kernel, indexed by reason code
+_REASON_NAMES = ('stop_loss', 'target', 'signal', 'end_of_period')
+
 @dataclass
 class BacktestTrade:
     """Represents a trade in backtesting"""
@@ -29,6 +49,123 @@ class BacktestTrade:
     def is_closed(self) -> bool:
         return self.exit_date is not None
 
+# One record per closed trade; reason is a code into _REASON_NAMES
+TRADE_DTYPE = np.dtype([
+    ('entry_idx', 'i8'),
+    ('exit_idx', 'i8'),
+    ('entry_price', 'f8'),
+    ('exit_price', 'f8'),
+    ('quantity', 'i8'),
+    ('pnl', 'f8'),
+    ('pnl_percent', 'f8'),
+    ('reason', 'i1'),
+])
+
+class TradeArray:
+    """Closed trades of one backtest, stored in a TRADE_DTYPE structured array"""
+    
+    def __init__(self,
+                 symbol: str,
+                 dates: Any,
+                 entry_idx: np.ndarray,
+                 exit_idx: np.ndarray,
+                 entry_price: np.ndarray,
+                 exit_price: np.ndarray,
+                 quantity: np.ndarray,
+                 reason: np.ndarray,
+                 trade_type: str = 'BUY'):
+        self.symbol = symbol
+        self.trade_type = trade_type
+        self.dates = dates  # datetime64-backed bar dates that entry_idx / exit_idx point into
+        
+        records = np.empty(len(entry_idx), dtype=TRADE_DTYPE)
+        records['entry_idx'] = entry_idx
+        records['exit_idx'] = exit_idx
+        records['entry_price'] = entry_price
+        records['exit_price'] = exit_price
+        records['quantity'] = quantity
+        records['pnl'] = (exit_price - entry_price) * quantity
+        records['pnl_percent'] = (records['pnl'] / (entry_price * quantity)) * 100
+        records['reason'] = reason
+        self.records = records
+    
+    @classmethod
+    def empty(cls, symbol: str = '') -> 'TradeArray':
+        """Trade array with no trades"""
+        return cls(symbol, pd.array([], dtype='datetime64[ns]'), np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0), np.empty(0),
+                   np.empty(0, np.int64), np.empty(0, np.int8))
+    
+    # Field views, so callers can treat the trades column-wise
+    entry_idx = property(lambda self: self.records['entry_idx'])
+    exit_idx = property(lambda self: self.records['exit_idx'])
+    entry_price = property(lambda self: self.records['entry_price'])
+    exit_price = property(lambda self: self.records['exit_price'])
+    quantity = property(lambda self: self.records['quantity'])
+    pnl = property(lambda self: self.records['pnl'])
+    pnl_percent = property(lambda self: self.records['pnl_percent'])
+    reason = property(lambda self: self.records['reason'])
+    
+    @property
+    def entry_dates(self) -> pd.DatetimeIndex:
+        """Entry dates of all trades, without boxing each one"""
+        return pd.DatetimeIndex(self.dates[self.entry_idx])
+    
+    @property
+    def exit_dates(self) -> pd.DatetimeIndex:
+        """Exit dates of all trades, without boxing each one"""
+        return pd.DatetimeIndex(self.dates[self.exit_idx])
+    
+    def to_records(self) -> List[Dict]:
+        """JSON-ready trade dicts, converted field by field rather than per trade object"""
+        columns = {
+            'entry_date': [date.isoformat() for date in self.entry_dates],
+            'exit_date': [date.isoformat() for date in self.exit_dates],
+            'entry_price': self.entry_price.tolist(),
+            'exit_price': self.exit_price.tolist(),
+            'quantity': self.quantity.tolist(),
+            'pnl': self.pnl.tolist(),
+            'pnl_percent': self.pnl_percent.tolist(),
+            'reason': [_REASON_NAMES[code] for code in self.reason.tolist()],
+        }
+        return [
+            {
+                'entry_date': entry_date,
+                'exit_date': exit_date,
+                'symbol': self.symbol,
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'quantity': quantity,
+                'trade_type': self.trade_type,
+                'pnl': pnl,
+                'pnl_percent': pnl_percent,
+                'reason': reason
+            }
+            for entry_date, exit_date, entry_price, exit_price, quantity, pnl, pnl_percent, reason
+            in zip(*columns.values())
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __getitem__(self, k: int) -> BacktestTrade:
+        trade = self.records[k]
+        return BacktestTrade(
+            entry_date=self.dates[trade['entry_idx']],
+            exit_date=self.dates[trade['exit_idx']],
+            symbol=self.symbol,
+            entry_price=trade['entry_price'],
+            exit_price=trade['exit_price'],
+            quantity=int(trade['quantity']),
+            trade_type=self.trade_type,
+            pnl=trade['pnl'],
+            pnl_percent=trade['pnl_percent'],
+            reason=_REASON_NAMES[trade['reason']]
+        )
+    
+    def __iter__(self):
+        """Materialize BacktestTrade objects lazily, one at a time"""
+        return (self[k] for k in range(len(self)))
+
 @dataclass
 class BacktestResults:
     """Results of a backtest"""
@@ -46,7 +183,7 @@ class BacktestResults:
     avg_loss: float
     max_drawdown: float
     sharpe_ratio: float
-    trades: List[BacktestTrade]
+    trades: TradeArray
     equity_curve: pd.DataFrame
     
     def to_dict(self) -> Dict:
@@ -66,30 +203,48 @@ class BacktestResults:
             'avg_loss': self.avg_loss,
             'max_drawdown': self.max_drawdown,
             'sharpe_ratio': self.sharpe_ratio,
-            'trades': [
-                {
-                    'entry_date': trade.entry_date.isoformat(),
-                    'exit_date': trade.exit_date.isoformat() if trade.exit_date else None,
-                    'symbol': trade.symbol,
-                    'entry_price': trade.entry_price,
-                    'exit_price': trade.exit_price,
-                    'quantity': trade.quantity,
-                    'trade_type': trade.trade_type,
-                    'pnl': trade.pnl,
-                    'pnl_percent': trade.pnl_percent,
-                    'reason': trade.reason
-                }
-                for trade in self.trades
-            ],
-            'equity_curve': self.equity_curve.to_dict('records') if not self.equity_curve.empty else []
+            'trades': self.trades.to_records(),
+            # Column-oriented, so each column converts in a single pass
+            'equity_curve': {
+                column: (self.equity_curve[column].map(pd.Timestamp.isoformat) if column == 'date'
+                         else self.equity_curve[column]).tolist()
+                for column in self.equity_curve.columns
+            }
         }
 
+@dataclass
+class PreparedRun:
+    """Signal arrays for one (strategy, symbol, period), reusable across risk parameters"""
+    symbol: str
+    start_date: str
+    end_date: str
+    dates: Any = None  # None when the backtest cannot run
+    closes: Optional[np.ndarray] = None
+    positions: Optional[np.ndarray] = None
+    
+    def is_runnable(self) -> bool:
+        return self.dates is not None
+
 class BacktestEngine:
     """Backtesting engine for trading strategies"""
     
+    # Maximum number of cached signal / historical data frames / prepared runs kept per engine
+    signal_cache_size = 128
+    data_cache_size = 32
+    prepared_cache_size = 128
+    
+    # Longer histories get their equity curve sampled down to about this many points
+    equity_curve_points = 5000
+    
+    # Seconds a fetched range ending today stays cached (closed ranges never change)
+    cache_duration = 3600
+    
     def __init__(self, initial_capital: float = 100000):
         self.initial_capital = initial_capital
         self.data_provider = get_data_provider(simulation_mode=False)
+        self._signal_cache = {}  # (strategy_name, data hash) -> signals DataFrame
+        self._data_cache = {}  # (symbol, start_date, end_date) -> (fetched_at, historical data DataFrame)
+        self._prepared_cache = {}  # (strategy_name, symbol, start_date, end_date) -> (prepared_at, PreparedRun)
         
     def run_backtest(self, 
                     strategy_name: str,
@@ -103,192 +258,359 @@ class BacktestEngine:
         
         logger.info(f"Starting backtest: {strategy_name} on {symbol} from {start_date} to {end_date}")
         
-        # Get historical data
+        prepared = self.prepare(strategy_name, symbol, start_date, end_date)
+        
+        return self.simulate(prepared, stop_loss_percent, target_percent, position_size_percent)
+    
+    def run_backtest_on_data(self,
+                            historical_data: pd.DataFrame,
+                            strategy_name: str,
+                            symbol: str,
+                            start_date: str,
+                            end_date: str,
+                            stop_loss_percent: float = 0.05,
+                            target_percent: float = 0.10,
+                            position_size_percent: float = 0.10) -> BacktestResults:
+        """Run a backtest on already loaded historical data (skips the data provider)"""
+        
+        prepared = self.prepare_on_data(historical_data, strategy_name, symbol, start_date, end_date)
+        
+        return self.simulate(prepared, stop_loss_percent, target_percent, position_size_percent)
+    
+    def prepare(self, strategy_name: str, symbol: str, start_date: str, end_date: str) -> PreparedRun:
+        """Fetch data and generate signals once for later simulate() calls"""
+        
+        key = (strategy_name, symbol, start_date, end_date)
+        entry = self._prepared_cache.get(key)
+        if entry is not None:
+            prepared_at, prepared = entry
+            if self._is_fresh(prepared_at, end_date):
+                return prepared
+            del self._prepared_cache[key]
+        
+        historical_data = self._get_historical_data(symbol, start_date, end_date)
+        prepared = self.prepare_on_data(historical_data, strategy_name, symbol, start_date, end_date)
+        
+        # Runs that could not be prepared are not cached so a later call can retry
+        if prepared.is_runnable():
+            if len(self._prepared_cache) >= self.prepared_cache_size:
+                self._prepared_cache.pop(next(iter(self._prepared_cache)))
+            self._prepared_cache[key] = (time.time(), prepared)
+        return prepared
+    
+    def prepare_on_data(self,
+                        historical_data: pd.DataFrame,
+                        strategy_name: str,
+                        symbol: str,
+                        start_date: str,
+                        end_date: str) -> PreparedRun:
+        """Generate signals on already loaded historical data for later simulate() calls"""
+        
+        signals = self._generate_signals(historical_data, strategy_name, symbol)
+        
+        if signals is None:
+            return PreparedRun(symbol, start_date, end_date)
+        
+        # Without buy/sell positions there is nothing to trade on
+        missing = [column for column in ('date', 'close', 'position') if column not in signals.columns]
+        if missing:
+            logger.warning(f"Signals for {strategy_name} on {symbol} are missing columns: {missing}")
+            return PreparedRun(symbol, start_date, end_date)
+        
+        return PreparedRun(symbol, start_date, end_date, *self._signal_arrays(signals))
+    
+    def simulate(self,
+                 prepared: PreparedRun,
+                 stop_loss_percent: float = 0.05,
+                 target_percent: float = 0.10,
+                 position_size_percent: float = 0.10,
+                 equity_sample_every: Optional[int] = None) -> BacktestResults:
+        """
+        Simulate trades for a prepared run with the given risk parameters
+        
+        Args:
+            equity_sample_every: Keep every Nth bar of the stored equity curve.
+                Defaults to a stride that keeps about equity_curve_points bars;
+                pass 1 for every bar. Drawdown and Sharpe always use every bar.
+        """
+        
+        if not prepared.is_runnable():
+            return self._empty_results(prepared.start_date, prepared.end_date)
+        
+        kernel_output = _simulate_trades_nb(
+            prepared.closes, prepared.positions, float(self.initial_capital),
+            stop_loss_percent, target_percent, position_size_percent
+        )
+        
+        return self._build_results(prepared.symbol, prepared.dates, kernel_output,
+                                   prepared.start_date, prepared.end_date, equity_sample_every)
+    
+    def run_parameter_sweep(self,
+                           strategy_name: str,
+                           symbol: str,
+                           start_date: str,
+                           end_date: str,
+                           param_combinations: List[Tuple[float, float]],
+                           position_size_percent: float = 0.10,
+                           historical_data: Optional[pd.DataFrame] = None) -> Dict[Tuple[float, float], BacktestResults]:
+        """
+        Backtest one strategy across several (stop_loss_percent, target_percent) pairs
+        
+        The run is prepared once (data fetched unless historical_data is
+        given, signals generated); only the trade simulation is repeated for
+        each parameter pair.
+        
+        Returns:
+            Dict mapping (stop_loss_percent, target_percent) to BacktestResults
+        """
+        
+        logger.info(f"Starting parameter sweep: {strategy_name} on {symbol} from {start_date} to {end_date} "
+                    f"({len(param_combinations)} combinations)")
+        
+        if historical_data is None:
+            prepared = self.prepare(strategy_name, symbol, start_date, end_date)
+        else:
+            prepared = self.prepare_on_data(historical_data, strategy_name, symbol, start_date, end_date)
+        
+        return {
+            (stop_loss_percent, target_percent): self.simulate(
+                prepared, stop_loss_percent, target_percent, position_size_percent
+            )
+            for stop_loss_percent, target_percent in param_combinations
+        }
+    
+    def run_many(self, jobs: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[BacktestResults]:
+        """
+        Run independent backtests in parallel across processes
+        
+        Args:
+            jobs: Keyword arguments for run_backtest, one dict per backtest
+            max_workers: Worker processes (defaults to the CPU count)
+            
+        Returns:
+            BacktestResults in the same order as jobs
+        """
+        
+        # Many small jobs with the same risk parameters are cheaper to run in
+        # this process on the compiled parallel kernel than to ship to workers
+        risk_params = {
+            (job.get('stop_loss_percent', 0.05), job.get('target_percent', 0.10),
+             job.get('position_size_percent', 0.10))
+            for job in jobs
+        }
+        if NUMBA_AVAILABLE and len(risk_params) == 1 and len(jobs) > (max_workers or os.cpu_count()):
+            return self._run_many_in_process(jobs, *risk_params.pop())
+        
+        # Fetch each distinct data range once here and hand it to every worker
+        # up front, so workers never go back to the data provider
+        data_cache = {}
+        for job in jobs:
+            key = (job['symbol'], job['start_date'], job['end_date'])
+            if key not in data_cache:
+                data_cache[key] = self._get_historical_data(*key)
+        
+        results = [None] * len(jobs)
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                 initializer=_init_worker, initargs=(data_cache,)) as executor:
+            futures = {
+                executor.submit(_run_job, self.initial_capital, job): i
+                for i, job in enumerate(jobs)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                logger.info(f"Completed backtest {done}/{len(jobs)}")
+        
+        return results
+    
+    def _run_many_in_process(self, jobs: List[Dict[str, Any]], stop_loss_percent: float,
+                             target_percent: float, position_size_percent: float) -> List[BacktestResults]:
+        """Run jobs sharing one set of risk parameters through _simulate_batch_nb"""
+        
+        results = [None] * len(jobs)
+        batch = []  # (job index, PreparedRun)
+        for i, job in enumerate(jobs):
+            prepared = self.prepare(job['strategy_name'], job['symbol'], job['start_date'], job['end_date'])
+            if prepared.is_runnable():
+                batch.append((i, prepared))
+            else:
+                results[i] = self._empty_results(job['start_date'], job['end_date'])
+        
+        if not batch:
+            return results
+        
+        # Stack every series into zero-padded 2D arrays; lengths mark the valid bars
+        lengths = np.array([len(prepared.closes) for _, prepared in batch], dtype=np.int64)
+        closes_2d = np.zeros((len(batch), lengths.max()), dtype=np.float64)
+        positions_2d = np.zeros((len(batch), lengths.max()), dtype=np.int8)
+        for row, (_, prepared) in enumerate(batch):
+            closes_2d[row, :lengths[row]] = prepared.closes
+            positions_2d[row, :lengths[row]] = prepared.positions
+        
+        counts, *columns = _simulate_batch_nb(
+            closes_2d, positions_2d, lengths, float(self.initial_capital),
+            stop_loss_percent, target_percent, position_size_percent
+        )
+        
+        for row, (i, prepared) in enumerate(batch):
+            count, length = counts[row], lengths[row]
+            kernel_output = tuple(column[row, :count] for column in columns[:6]) + \
+                tuple(column[row, :length] for column in columns[6:])
+            results[i] = self._build_results(prepared.symbol, prepared.dates, kernel_output,
+                                             prepared.start_date, prepared.end_date)
+        
+        return results
+    
+    def _is_fresh(self, cached_at: float, end_date: str) -> bool:
+        """Check if data cached at the given time is still usable for a range"""
+        # Ranges that ended before today can no longer change
+        if end_date < datetime.now().strftime("%Y-%m-%d"):
+            return True
+        
+        return (time.time() - cached_at) < self.cache_duration
+    
+    def _get_historical_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """Get historical data, reusing frames already fetched by this engine"""
+        key = (symbol, start_date, end_date)
+        entry = self._data_cache.get(key)
+        if entry is not None:
+            fetched_at, historical_data = entry
+            if self._is_fresh(fetched_at, end_date):
+                return historical_data
+            del self._data_cache[key]
+        
         historical_data = self.data_provider.get_historical_data(symbol, start_date, end_date)
+        # Failed fetches are not cached so a later call can retry
+        if not historical_data.empty:
+            if len(self._data_cache) >= self.data_cache_size:
+                self._data_cache.pop(next(iter(self._data_cache)))
+            self._data_cache[key] = (time.time(), historical_data)
+        return historical_data
+    
+    def _generate_signals(self, historical_data: pd.DataFrame, strategy_name: str, symbol: str) -> Optional[pd.DataFrame]:
+        """Generate strategy signals, returning None if the backtest cannot run"""
         
         if historical_data.empty:
             logger.error(f"No historical data found for {symbol}")
-            return self._empty_results(start_date, end_date)
+            return None
         
         # Initialize strategy
         if strategy_name not in STRATEGIES:
             logger.error(f"Strategy {strategy_name} not found")
-            return self._empty_results(start_date, end_date)
-        
-        strategy = STRATEGIES[strategy_name]()
+            return None
         
-        # Generate signals
-        try:
-            signals = strategy.generate_signals(historical_data)
-        except Exception as e:
-            logger.error(f"Error generating signals for {strategy_name} on {symbol}: {e}")
-            logger.error(f"Available columns: {list(historical_data.columns)}")
-            return self._empty_results(start_date, end_date)
+        # Signals are a pure function of (strategy, data), so reuse them across runs
+        cache_key = (strategy_name, self._hash_data(historical_data))
+        if cache_key in self._signal_cache:
+            signals = self._signal_cache[cache_key]
+        else:
+            strategy = STRATEGIES[strategy_name]()
+            
+            # Generate signals
+            try:
+                signals = strategy.generate_signals(historical_data)
+            except Exception as e:
+                logger.error(f"Error generating signals for {strategy_name} on {symbol}: {e}")
+                logger.error(f"Available columns: {list(historical_data.columns)}")
+                return None
+            
+            if len(self._signal_cache) >= self.signal_cache_size:
+                self._signal_cache.pop(next(iter(self._signal_cache)))
+            self._signal_cache[cache_key] = signals
 
         if signals.empty:
             logger.warning(f"No signals generated for {strategy_name} on {symbol}")
-            return self._empty_results(start_date, end_date)
+            return None
         
-        # Run simulation
-        return self._simulate_trades(
-            historical_data, signals, symbol, start_date, end_date,
-            stop_loss_percent, target_percent, position_size_percent
-        )
+        return signals
     
-    def _simulate_trades(self, 
-                        data: pd.DataFrame, 
-                        signals: pd.DataFrame,
-                        symbol: str,
-                        start_date: str,
-                        end_date: str,
-                        stop_loss_percent: float,
-                        target_percent: float,
-                        position_size_percent: float) -> BacktestResults:
-        """Simulate trades based on signals"""
-        
-        capital = self.initial_capital
-        trades = []
-        open_trades = []
-        equity_curve = []
-        
-        # Use signals directly since it already contains all the data
-        combined = signals.copy()
-        combined = combined.fillna(0)  # Fill NaN signals with 0
-        
-        for idx, row in combined.iterrows():
-            current_date = row['date']
-            current_price = row['close']
-            
-            # Check for exit conditions on open trades
-            for trade in open_trades[:]:  # Use slice to avoid modification during iteration
-                # Check stop loss
-                if current_price <= trade.entry_price * (1 - stop_loss_percent):
-                    trade.exit_date = current_date
-                    trade.exit_price = current_price
-                    trade.pnl = (trade.exit_price - trade.entry_price) * trade.quantity
-                    trade.pnl_percent = (trade.pnl / (trade.entry_price * trade.quantity)) * 100
-                    trade.reason = 'stop_loss'
-                    capital += trade.exit_price * trade.quantity
-                    trades.append(trade)
-                    open_trades.remove(trade)
-                    continue
-                
-                # Check target
-                if current_price >= trade.entry_price * (1 + target_percent):
-                    trade.exit_date = current_date
-                    trade.exit_price = current_price
-                    trade.pnl = (trade.exit_price - trade.entry_price) * trade.quantity
-                    trade.pnl_percent = (trade.pnl / (trade.entry_price * trade.quantity)) * 100
-                    trade.reason = 'target'
-                    capital += trade.exit_price * trade.quantity
-                    trades.append(trade)
-                    open_trades.remove(trade)
-                    continue
-            
-            # Check for new buy signals (position change from 0 to 1)
-            if hasattr(row, 'position') and row.position == 1 and len(open_trades) == 0:
-                # Calculate position size
-                position_value = capital * position_size_percent
-                quantity = int(position_value / current_price)
-                
-                if quantity > 0:
-                    trade = BacktestTrade(
-                        entry_date=current_date,
-                        exit_date=None,
-                        symbol=symbol,
-                        entry_price=current_price,
-                        exit_price=None,
-                        quantity=quantity,
-                        trade_type='BUY',
-                        pnl=None,
-                        pnl_percent=None,
-                        reason=''
-                    )
-                    
-                    capital -= current_price * quantity
-                    open_trades.append(trade)
-            
-            # Check for sell signals to close positions (position change from 1 to 0)
-            if hasattr(row, 'position') and row.position == -1:
-                for trade in open_trades[:]:
-                    trade.exit_date = current_date
-                    trade.exit_price = current_price
-                    trade.pnl = (trade.exit_price - trade.entry_price) * trade.quantity
-                    trade.pnl_percent = (trade.pnl / (trade.entry_price * trade.quantity)) * 100
-                    trade.reason = 'signal'
-                    capital += trade.exit_price * trade.quantity
-                    trades.append(trade)
-                    open_trades.remove(trade)
-            
-            # Calculate current portfolio value
-            portfolio_value = capital
-            for trade in open_trades:
-                portfolio_value += current_price * trade.quantity
-            
-            equity_curve.append({
-                'date': current_date,
-                'portfolio_value': portfolio_value,
-                'capital': capital,
-                'positions_value': portfolio_value - capital
-            })
-        
-        # Close any remaining open trades at the end
-        if open_trades:
-            final_price = combined.iloc[-1]['close']
-            final_date = combined.iloc[-1]['date']
-            
-            for trade in open_trades:
-                trade.exit_date = final_date
-                trade.exit_price = final_price
-                trade.pnl = (trade.exit_price - trade.entry_price) * trade.quantity
-                trade.pnl_percent = (trade.pnl / (trade.entry_price * trade.quantity)) * 100
-                trade.reason = 'end_of_period'
-                capital += trade.exit_price * trade.quantity
-                trades.append(trade)
-        
-        # Calculate metrics
-        return self._calculate_metrics(trades, equity_curve, start_date, end_date)
-    
-    def _calculate_metrics(self, trades: List[BacktestTrade], equity_curve: List[Dict], 
+    @staticmethod
+    def _hash_data(data: pd.DataFrame) -> str:
+        """Stable content hash of a DataFrame (DataFrames themselves are unhashable)"""
+        row_hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        return hashlib.sha1(row_hashes.tobytes() + ",".join(map(str, data.columns)).encode()).hexdigest()
+    
+    @staticmethod
+    def _signal_arrays(signals: pd.DataFrame) -> Tuple[Any, np.ndarray, np.ndarray]:
+        """Pull the (dates, closes, positions) columns the simulation kernel needs out as arrays"""
+        
+        # NaNs are filled during the conversion so no intermediate Series is built
+        dates = pd.to_datetime(signals['date']).array  # int64-backed; boxed only on access
+        closes = signals['close'].to_numpy(dtype=np.float64, na_value=0.0)
+        positions = signals['position'].to_numpy(dtype=np.int8, na_value=0)
+        return dates, closes, positions
+    
+    def _build_results(self, symbol: str, dates: Any, kernel_output: Tuple[np.ndarray, ...],
+                       start_date: str, end_date: str,
+                       equity_sample_every: Optional[int] = None) -> BacktestResults:
+        """Turn the simulation kernel's arrays into BacktestResults"""
+        
+        (entry_idx, exit_idx, entry_px, exit_px, qty, reason,
+         portfolio_value, capital) = kernel_output
+        
+        trades = TradeArray(symbol, dates, entry_idx, exit_idx, entry_px, exit_px, qty, reason)
+        
+        # Drawdown is taken on every bar, before the curve is sampled for storage
+        peak = np.maximum.accumulate(portfolio_value)
+        drawdown = (portfolio_value - peak) / peak
+        columns = (dates, portfolio_value, capital, peak, drawdown)
+        
+        # Sample long equity curves down, always keeping the final bar
+        n = len(portfolio_value)
+        stride = equity_sample_every or max(1, n // self.equity_curve_points)
+        if stride > 1:
+            sample = np.arange(0, n, stride)
+            if sample[-1] != n - 1:
+                sample = np.append(sample, n - 1)
+            columns = tuple(column[sample] for column in columns)
+        
+        # Built once from the kernel's columns rather than one dict per bar
+        sampled_dates, sampled_value, sampled_capital, sampled_peak, sampled_drawdown = columns
+        equity_curve = pd.DataFrame({
+            'date': sampled_dates,
+            'portfolio_value': sampled_value,
+            'capital': sampled_capital,
+            'positions_value': sampled_value - sampled_capital,
+            'peak': sampled_peak,
+            'drawdown': sampled_drawdown
+        })
+        
+        # Calculate metrics on the full series
+        return self._calculate_metrics(trades, equity_curve, portfolio_value, drawdown, start_date, end_date)
+    
+    def _calculate_metrics(self, trades: TradeArray, equity_curve: pd.DataFrame,
+                          portfolio_value: np.ndarray, drawdown: np.ndarray,
                           start_date: str, end_date: str) -> BacktestResults:
-        """Calculate backtest metrics"""
+        """Calculate backtest metrics from the per-bar portfolio value and drawdown"""
         
         if not trades:
             return self._empty_results(start_date, end_date)
         
-        # Basic metrics
+        # Basic metrics, all from the trades' P&L column
+        pnls = trades.pnl
+        winning_mask = pnls > 0
+        losing_mask = pnls < 0
+        
         total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.pnl > 0])
-        losing_trades = len([t for t in trades if t.pnl < 0])
+        winning_trades = int(winning_mask.sum())
+        losing_trades = int(losing_mask.sum())
         
         win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
         
-        profits = [t.pnl for t in trades if t.pnl > 0]
-        losses = [t.pnl for t in trades if t.pnl < 0]
+        avg_profit = pnls[winning_mask].mean() if winning_trades else 0
+        avg_loss = pnls[losing_mask].mean() if losing_trades else 0
         
-        avg_profit = np.mean(profits) if profits else 0
-        avg_loss = np.mean(losses) if losses else 0
-        
-        total_pnl = sum(t.pnl for t in trades)
+        total_pnl = pnls.sum()
         final_capital = self.initial_capital + total_pnl
         total_return_percent = (total_pnl / self.initial_capital) * 100
         
         # Calculate max drawdown
-        equity_df = pd.DataFrame(equity_curve)
-        if not equity_df.empty:
-            equity_df['peak'] = equity_df['portfolio_value'].cummax()
-            equity_df['drawdown'] = (equity_df['portfolio_value'] - equity_df['peak']) / equity_df['peak']
-            max_drawdown = equity_df['drawdown'].min() * 100
-        else:
-            max_drawdown = 0
+        max_drawdown = drawdown.min() * 100 if len(drawdown) else 0
         
         # Calculate Sharpe ratio (simplified)
-        if not equity_df.empty and len(equity_df) > 1:
-            returns = equity_df['portfolio_value'].pct_change().dropna()
-            if returns.std() > 0:
-                sharpe_ratio = (returns.mean() / returns.std()) * np.sqrt(252)  # Annualized
-            else:
-                sharpe_ratio = 0
+        returns = np.diff(portfolio_value) / portfolio_value[:-1] if len(portfolio_value) > 1 else np.empty(0)
+        returns_std = returns.std(ddof=1) if len(returns) > 1 else 0
+        if returns_std > 0:
+            sharpe_ratio = (returns.mean() / returns_std) * np.sqrt(252)  # Annualized
         else:
             sharpe_ratio = 0
         
@@ -308,7 +630,7 @@ class BacktestEngine:
             max_drawdown=max_drawdown,
             sharpe_ratio=sharpe_ratio,
             trades=trades,
-            equity_curve=equity_df if not equity_df.empty else pd.DataFrame()
+            equity_curve=equity_curve if not equity_curve.empty else pd.DataFrame()
         )
     
     def _empty_results(self, start_date: str, end_date: str) -> BacktestResults:
@@ -328,10 +650,186 @@ class BacktestEngine:
             avg_loss=0,
             max_drawdown=0,
             sharpe_ratio=0,
-            trades=[],
+            trades=TradeArray.empty(),
             equity_curve=pd.DataFrame()
         )
 
+@njit(cache=True)
+def _simulate_trades_nb(closes, positions, initial_capital, stop_loss_percent, target_percent,
+                        position_size_percent):
+    """
+    Long-only trade simulation over bar arrays, at most one open trade at a time
+    
+    Rather than stepping bar by bar, the kernel jumps from each entry to the
+    first bar that hits the stop-loss, the target or a sell signal, found
+    with vectorized scans over that trade's bars.
+    
+    Returns:
+        Closed trades as (entry_idx, exit_idx, entry_price, exit_price,
+        quantity, reason_code) arrays, followed by the per-bar portfolio
+        value and cash arrays
+    """
+    n = len(closes)
+    
+    # Buy on a position change from 0 to 1, sell on a change from 1 to 0
+    buys = np.flatnonzero(positions == 1)
+    sells = np.flatnonzero(positions == -1)
+    
+    # Every trade starts on its own buy signal, which bounds the trade count
+    max_trades = len(buys)
+    entry_idx = np.empty(max_trades, np.int64)
+    exit_idx = np.empty(max_trades, np.int64)
+    entry_px = np.empty(max_trades, np.float64)
+    exit_px = np.empty(max_trades, np.float64)
+    qty = np.empty(max_trades, np.int64)
+    reason = np.empty(max_trades, np.int8)
+    portfolio_value = np.empty(n, np.float64)
+    cash = np.empty(n, np.float64)
+    
+    capital = initial_capital
+    count = 0
+    i = 0
+    while i < n:
+        # Next buy signal at or after bar i
+        b = np.searchsorted(buys, i)
+        if b == len(buys):
+            portfolio_value[i:] = capital
+            cash[i:] = capital
+            break
+        j = buys[b]
+        portfolio_value[i:j] = capital
+        cash[i:j] = capital
+        
+        price = closes[j]
+        quantity = int(capital * position_size_percent / price)
+        if quantity <= 0:
+            portfolio_value[j] = capital
+            cash[j] = capital
+            i = j + 1
+            continue
+        capital -= price * quantity
+        portfolio_value[j] = capital + price * quantity
+        cash[j] = capital
+        
+        # Exits can only happen up to (and including) the next sell signal
+        s = np.searchsorted(sells, j + 1)
+        has_sell = s < len(sells)
+        last = sells[s] if has_sell else n - 1
+        
+        # Stop-loss, target and sell signal are tested in one pass over the
+        # window; the sell bar (if any) is the window's last bar
+        stop_line = price * (1 - stop_loss_percent)
+        target_line = price * (1 + target_percent)
+        window = closes[j + 1:last + 1]
+        hit_stop = window <= stop_line
+        hit_target = window >= target_line
+        exits = hit_stop | hit_target
+        if has_sell:
+            exits[-1] = True
+        
+        k = np.argmax(exits) if len(exits) > 0 else 0
+        if len(exits) == 0 or not exits[k]:
+            # Still open at the end: close at the last price
+            portfolio_value[j + 1:] = capital + closes[j + 1:] * quantity
+            cash[j + 1:] = capital
+            entry_idx[count] = j
+            exit_idx[count] = n - 1
+            entry_px[count] = price
+            exit_px[count] = closes[n - 1]
+            qty[count] = quantity
+            reason[count] = 3
+            count += 1
+            break
+        
+        # Priority-encode the exit reason without a branch ladder:
+        # stop-loss -> 0, else target -> 1, else sell signal -> 2
+        stop = int(hit_stop[k])
+        target = int(hit_target[k])
+        code = 2 * (1 - (stop | target)) + (target & (1 - stop))
+        k += j + 1
+        
+        portfolio_value[j + 1:k] = capital + closes[j + 1:k] * quantity
+        cash[j + 1:k] = capital
+        capital += closes[k] * quantity
+        portfolio_value[k] = capital
+        cash[k] = capital
+        entry_idx[count] = j
+        exit_idx[count] = k
+        entry_px[count] = price
+        exit_px[count] = closes[k]
+        qty[count] = quantity
+        reason[count] = code
+        count += 1
+        
+        # A stop-loss or target exit frees the bar for a new entry; a sell
+        # signal bar can't also be a buy
+        i = k + (code >> 1)
+    
+    return (entry_idx[:count], exit_idx[:count], entry_px[:count], exit_px[:count],
+            qty[:count], reason[:count], portfolio_value, cash)
+
+@njit(parallel=True, cache=True)
+def _simulate_batch_nb(closes_2d, positions_2d, lengths, initial_capital, stop_loss_percent, target_percent,
+                       position_size_percent):
+    """
+    Run _simulate_trades_nb over many zero-padded series in parallel
+    
+    Returns:
+        Per-series trade counts, then _simulate_trades_nb's outputs as 2D
+        arrays with one row per series
+    """
+    n_series, n_bars = closes_2d.shape
+    max_trades = np.sum(positions_2d == 1, axis=1).max()  # see _simulate_trades_nb
+    counts = np.zeros(n_series, np.int64)
+    entry_idx = np.zeros((n_series, max_trades), np.int64)
+    exit_idx = np.zeros((n_series, max_trades), np.int64)
+    entry_px = np.zeros((n_series, max_trades), np.float64)
+    exit_px = np.zeros((n_series, max_trades), np.float64)
+    qty = np.zeros((n_series, max_trades), np.int64)
+    reason = np.zeros((n_series, max_trades), np.int8)
+    portfolio_value = np.zeros((n_series, n_bars), np.float64)
+    cash = np.zeros((n_series, n_bars), np.float64)
+    
+    for s in prange(n_series):
+        m = lengths[s]
+        out = _simulate_trades_nb(closes_2d[s, :m], positions_2d[s, :m], initial_capital,
+                                  stop_loss_percent, target_percent, position_size_percent)
+        k = len(out[0])
+        counts[s] = k
+        entry_idx[s, :k] = out[0]
+        exit_idx[s, :k] = out[1]
+        entry_px[s, :k] = out[2]
+        exit_px[s, :k] = out[3]
+        qty[s, :k] = out[4]
+        reason[s, :k] = out[5]
+        portfolio_value[s, :m] = out[6]
+        cash[s, :m] = out[7]
+    
+    return counts, entry_idx, exit_idx, entry_px, exit_px, qty, reason, portfolio_value, cash
+
+def warm_up_kernels():
+    """Compile the simulation kernels up front so the first backtest doesn't pay for it"""
+    if not NUMBA_AVAILABLE:
+        return
+    
+    closes = np.ones(2, dtype=np.float64)
+    positions = np.array([1, -1], dtype=np.int8)
+    _simulate_trades_nb(closes, positions, 1.0, 0.05, 0.10, 0.10)
+    _simulate_batch_nb(closes[None, :], positions[None, :], np.array([2], dtype=np.int64), 1.0, 0.05, 0.10, 0.10)
+
+# Historical data shared with run_many worker processes, keyed by (symbol, start, end)
+_worker_data = {}
+
+def _init_worker(data_cache: Dict[Tuple[str, str, str], pd.DataFrame]):
+    """Install the pre-fetched historical data in a worker process"""
+    _worker_data.update(data_cache)
+
+def _run_job(initial_capital: float, job: Dict[str, Any]) -> BacktestResults:
+    """Run one run_many job in a worker process"""
+    engine = BacktestEngine(initial_capital=initial_capital)
+    historical_data = _worker_data[(job['symbol'], job['start_date'], job['end_date'])]
+    return engine.run_backtest_on_data(historical_data, **job)
+
 # Global backtest engine instance
 _backtest_engine = None
 
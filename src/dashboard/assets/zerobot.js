@@ -0,0 +1,160 @@
+/* Clientside callbacks for the ZeroBot dashboard */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    zerobot: {
+        botRunning: false,
+        refreshIntervals: {active: 2000, idle: 30000},  // Replaced by the server's values on load
+        maxChartPoints: 1000,
+        marketRange: 'market-1m',
+
+        // Refresh period in milliseconds for the current bot and tab state
+        refreshInterval: function (running) {
+            const intervals = window.dash_clientside.zerobot.refreshIntervals;
+            return (running && !document.hidden) ? intervals.active : intervals.idle;
+        },
+
+        adaptInterval: function (running, intervals) {
+            const zerobot = window.dash_clientside.zerobot;
+            zerobot.botRunning = Boolean(running);
+            if (intervals) {
+                zerobot.refreshIntervals = intervals;
+            }
+            return zerobot.refreshInterval(running);
+        },
+
+        // Placeholder figure shown while there is nothing to plot
+        emptyFigure: function () {
+            return {
+                data: [],
+                layout: {
+                    paper_bgcolor: 'rgba(0,0,0,0)',
+                    plot_bgcolor: 'rgba(0,0,0,0)',
+                    xaxis: {showgrid: false},
+                    yaxis: {showgrid: false},
+                    annotations: [{
+                        text: 'No trade data available',
+                        xref: 'paper',
+                        yref: 'paper',
+                        showarrow: false,
+                        font: {size: 20, color: 'white'}
+                    }]
+                }
+            };
+        },
+
+        // Cumulative P&L line from the trade history store
+        buildPnlChart: function (history) {
+            if (!history || history.length === 0) {
+                return window.dash_clientside.zerobot.emptyFigure();
+            }
+
+            // ISO timestamps sort chronologically as plain strings
+            const trades = history.slice().sort(function (a, b) {
+                return a.timestamp < b.timestamp ? -1 : (a.timestamp > b.timestamp ? 1 : 0);
+            });
+
+            let total = 0;
+            let x = trades.map(function (trade) { return trade.timestamp; });
+            let y = trades.map(function (trade) { return (total += trade.pnl); });
+
+            // Keep every Nth point (and the last) so long histories stay chart-sized
+            const stride = Math.max(1, Math.floor(y.length / window.dash_clientside.zerobot.maxChartPoints));
+            if (stride > 1) {
+                const keep = function (value, i, values) { return i % stride === 0 || i === values.length - 1; };
+                x = x.filter(keep);
+                y = y.filter(keep);
+            }
+
+            return {
+                data: [{
+                    type: 'scattergl',  // WebGL keeps long histories responsive
+                    x: x,
+                    y: y,
+                    mode: 'lines+markers',
+                    name: 'P&L',
+                    line: {width: 3, color: '#00FF00'},
+                    marker: {size: 8, color: '#00FF00'}
+                }],
+                layout: {
+                    paper_bgcolor: 'rgba(0,0,0,0)',
+                    plot_bgcolor: 'rgba(0,0,0,0)',
+                    margin: {l: 40, r: 40, t: 10, b: 40},
+                    xaxis: {
+                        showgrid: false,
+                        showline: true,
+                        linecolor: '#444',
+                        linewidth: 1,
+                        title: null
+                    },
+                    yaxis: {
+                        showgrid: true,
+                        gridcolor: '#444',
+                        showline: true,
+                        linecolor: '#444',
+                        linewidth: 1,
+                        title: null,
+                        tickprefix: '₹'
+                    },
+                    hovermode: 'x unified'
+                }
+            };
+        },
+
+        // Market index figure for the last clicked range button (1M until one is clicked)
+        pickMarketFigure: function (day, week, month, threeMonths, market) {
+            if (!market) {
+                return window.dash_clientside.no_update;
+            }
+
+            const zerobot = window.dash_clientside.zerobot;
+            const triggered = window.dash_clientside.callback_context.triggered || [];
+            const buttonId = triggered.length ? triggered[0].prop_id.split('.')[0] : '';
+            if (buttonId in market.figures) {
+                zerobot.marketRange = buttonId;
+            }
+            return market.figures[zerobot.marketRange];
+        },
+
+        // Winning/losing split from the app state store
+        buildTradeDistribution: function (state) {
+            const winning = state ? state.metrics.winning_trades : 0;
+            const losing = state ? state.metrics.losing_trades : 0;
+
+            if (!winning && !losing) {
+                return window.dash_clientside.zerobot.emptyFigure();
+            }
+
+            return {
+                data: [{
+                    type: 'pie',
+                    labels: ['Winning Trades', 'Losing Trades'],
+                    values: [winning, losing],
+                    marker: {colors: ['#00FF00', '#FF0000']},
+                    textinfo: 'percent',
+                    hole: 0.6
+                }],
+                layout: {
+                    paper_bgcolor: 'rgba(0,0,0,0)',
+                    plot_bgcolor: 'rgba(0,0,0,0)',
+                    margin: {l: 20, r: 20, t: 20, b: 20},
+                    showlegend: true,
+                    legend: {
+                        orientation: 'h',
+                        yanchor: 'bottom',
+                        y: -0.2,
+                        xanchor: 'center',
+                        x: 0.5
+                    }
+                }
+            };
+        }
+    }
+});
+
+// Re-evaluate the refresh period when the tab is hidden or shown again
+document.addEventListener('visibilitychange', function () {
+    const zerobot = window.dash_clientside.zerobot;
+    window.dash_clientside.set_props('interval-component', {
+        interval: zerobot.refreshInterval(zerobot.botRunning)
+    });
+});
@@ -0,0 +1,42 @@
+"""
+Caching helpers for the ZeroBot dashboard
+"""
+import threading
+import time
+from functools import wraps
+
+# Interval-callback refresh periods in milliseconds, while the bot runs and otherwise
+ACTIVE_REFRESH_INTERVAL = 2000
+IDLE_REFRESH_INTERVAL = 30000
+
+# Seconds a fetched value is shared between callbacks; half the active refresh
+# period, so every tick sees fresh data while tabs refreshing together share a fetch
+DATA_CACHE_TIMEOUT = ACTIVE_REFRESH_INTERVAL / 2000
+
+def ttl_memoize(timeout=DATA_CACHE_TIMEOUT):
+    """Memoize a zero-argument fetcher for `timeout` seconds
+    
+    Every open browser tab fires the interval callbacks independently, so the
+    bot is asked for the same data several times per refresh. The lock makes
+    concurrent callers wait for a single fetch instead of racing to repeat it.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'expires': 0.0, 'value': None}
+        
+        @wraps(func)
+        def wrapper():
+            with lock:
+                now = time.monotonic()
+                if now >= state['expires']:
+                    state['value'] = func()
+                    state['expires'] = now + timeout
+                return state['value']
+        
+        def cache_clear():
+            with lock:
+                state['expires'] = 0.0
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
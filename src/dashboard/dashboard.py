@@ -2,11 +2,15 @@
 Dashboard module for the ZeroBot application
 """
 import logging
+from functools import cache
 import dash
-from dash import dcc, html, callback, Input, Output, State
+from dash import dcc, html, dash_table, callback, Input, Output, State, ClientsideFunction, Patch, no_update
+from dash.exceptions import PreventUpdate
+from dash.dash_table.Format import Format, Scheme, Symbol
 import dash_bootstrap_components as dbc
 import dash_daq as daq
 import plotly.graph_objs as go
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -18,11 +22,60 @@ from src.dashboard.pages.strategies import create_strategies_layout, register_st
 from src.dashboard.pages.analytics import create_analytics_layout, register_analytics_callbacks
 from src.dashboard.pages.settings import create_settings_layout, register_settings_callbacks
 
+# Import formatting helpers
+from src.dashboard.caching import ttl_memoize, ACTIVE_REFRESH_INTERVAL, IDLE_REFRESH_INTERVAL
+from src.dashboard.formatting import format_money, format_percent
+
 # Import simulation engine
 from src.simulation.engine import get_simulation_engine
 
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional; plotly then uses the stdlib json encoder
+    ORJSON_AVAILABLE = False
+
+try:
+    import flask_compress  # noqa: F401
+    FLASK_COMPRESS_AVAILABLE = True
+except ImportError:  # flask-compress (dash[compress]) is optional; responses then go out uncompressed
+    FLASK_COMPRESS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Column formats and dark theme shared by the overview tables
+MONEY = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_prefix='₹')
+PERCENT = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_suffix='%')
+
+ACTIVE_TRADE_COLUMNS = [
+    {'name': 'Symbol', 'id': 'symbol'},
+    {'name': 'Quantity', 'id': 'quantity', 'type': 'numeric'},
+    {'name': 'Buy Price', 'id': 'buy_price', 'type': 'numeric', 'format': MONEY},
+    {'name': 'Current Price', 'id': 'current_price', 'type': 'numeric', 'format': MONEY},
+    {'name': 'P&L', 'id': 'pnl', 'type': 'numeric', 'format': MONEY},
+    {'name': 'P&L %', 'id': 'pnl_percent', 'type': 'numeric', 'format': PERCENT}
+]
+
+TRADE_HISTORY_COLUMNS = [
+    {'name': 'Symbol', 'id': 'symbol'},
+    {'name': 'Quantity', 'id': 'quantity', 'type': 'numeric'},
+    {'name': 'Buy Price', 'id': 'buy_price', 'type': 'numeric', 'format': MONEY},
+    {'name': 'Sell Price', 'id': 'sell_price', 'type': 'numeric', 'format': MONEY},
+    {'name': 'P&L', 'id': 'pnl', 'type': 'numeric', 'format': MONEY},
+    {'name': 'P&L %', 'id': 'pnl_percent', 'type': 'numeric', 'format': PERCENT},
+    {'name': 'Reason', 'id': 'reason'},
+    {'name': 'Timestamp', 'id': 'timestamp'}
+]
+
+TABLE_STYLE = {
+    'style_header': {'backgroundColor': '#1e1e1e', 'color': '#aaa', 'fontWeight': 600, 'border': '1px solid #333'},
+    'style_cell': {'backgroundColor': 'transparent', 'color': '#eee', 'border': '1px solid #333', 'textAlign': 'left'},
+    'style_data_conditional': [
+        {'if': {'filter_query': '{pnl} >= 0', 'column_id': ['pnl', 'pnl_percent']}, 'color': '#00ff8c'},
+        {'if': {'filter_query': '{pnl} < 0', 'column_id': ['pnl', 'pnl_percent']}, 'color': '#ff5252'}
+    ]
+}
+
 def create_dashboard(trade_bot):
     """Create the dashboard application"""
     # Initialize the Dash app
@@ -34,12 +87,38 @@ def create_dashboard(trade_bot):
             'https://use.fontawesome.com/releases/v5.15.4/css/all.css'
         ],
         suppress_callback_exceptions=True,
+        compress=FLASK_COMPRESS_AVAILABLE,  # Figure JSON shrinks several-fold under gzip
         meta_tags=[{'name': 'viewport', 'content': 'width=device-width, initial-scale=1.0'}]
     )
     
     # Set the title
     app.title = "ZeroBot - Automated Trading Bot"
     
+    # Dash serializes every callback response (figures included) through plotly's JSON encoder
+    if ORJSON_AVAILABLE:
+        pio.json.config.default_engine = 'orjson'
+    
+    # Shared data fetchers for the interval callbacks
+    @ttl_memoize()
+    def _cached_metrics():
+        return trade_bot.get_metrics()
+    
+    @ttl_memoize()
+    def _cached_active_trades():
+        return trade_bot.get_active_trades()
+    
+    @ttl_memoize()
+    def _cached_trade_history():
+        return trade_bot.get_trade_history()
+    
+    @ttl_memoize()
+    def _cached_margins():
+        return trade_bot.get_margins()
+    
+    @ttl_memoize()
+    def _cached_positions():
+        return get_simulation_engine().get_positions()
+    
     # Create the app layout
     app.layout = html.Div([
         # URL location component
@@ -48,6 +127,17 @@ def create_dashboard(trade_bot):
         # Page content
         html.Div(id='page-content'),
         
+        # Which view page-content holds ('login' or 'app')
+        dcc.Store(id='auth-state'),
+        
+        # Data shared by the overview callbacks
+        dcc.Store(id='app-state'),
+        dcc.Store(id='trade-history-store'),
+        
+        # Whether the bot is running, drives the refresh rate
+        dcc.Store(id='bot-running-store', data=False),
+        dcc.Store(id='refresh-intervals', data={'active': ACTIVE_REFRESH_INTERVAL, 'idle': IDLE_REFRESH_INTERVAL}),
+        
         # Interval component for refreshing data
         dcc.Interval(
             id='interval-component',
@@ -57,23 +147,25 @@ def create_dashboard(trade_bot):
     ])
     
     # Login page
-    login_layout = html.Div([
-        html.Div([
+    def create_login_layout():
+        return html.Div([
             html.Div([
-                html.Img(src='/assets/logo.svg', className='login-logo'),
-                html.H1("ZeroBot", className='login-title'),
-                html.H3("Automated Trading Bot", className='login-subtitle'),
-                
                 html.Div([
-                    dbc.Button("Login with Zerodha", id='login-button', color='success', size='lg', className='login-button'),
-                    dbc.Button("Demo Mode", id='demo-button', color='primary', size='lg', className='login-button ms-2'),
-                    html.Div(id='login-status')
-                ], className='login-form')
-            ], className='login-container')
-        ], className='login-page')
-    ])
+                    html.Img(src='/assets/logo.svg', className='login-logo'),
+                    html.H1("ZeroBot", className='login-title'),
+                    html.H3("Automated Trading Bot", className='login-subtitle'),
+                    
+                    html.Div([
+                        dbc.Button("Login with Zerodha", id='login-button', color='success', size='lg', className='login-button'),
+                        dbc.Button("Demo Mode", id='demo-button', color='primary', size='lg', className='login-button ms-2'),
+                        html.Div(id='login-status')
+                    ], className='login-form')
+                ], className='login-container')
+            ], className='login-page')
+        ])
     
-    # Main dashboard layout
+    # Main dashboard layout (static, so it is built once and shared by every page)
+    @cache
     def create_main_layout():
         return html.Div([
             # Navbar
@@ -95,7 +187,7 @@ def create_dashboard(trade_bot):
                             dbc.NavItem(dbc.NavLink([html.I(className="fas fa-brain me-2"), "Strategies"], href="/strategies")),
                             dbc.NavItem(dbc.NavLink([html.I(className="fas fa-chart-bar me-2"), "Analytics"], href="/analytics")),
                             dbc.NavItem(dbc.NavLink([html.I(className="fas fa-cog me-2"), "Settings"], href="/settings")),
-                            dbc.NavItem(dbc.NavLink([html.I(className="fas fa-sign-out-alt me-2"), "Logout"], href="/logout"))
+                            dbc.NavItem(dbc.NavLink([html.I(className="fas fa-sign-out-alt me-2"), "Logout"], href="/logout", external_link=True))
                         ], className="ms-auto", navbar=True),
                         id="navbar-collapse",
                         navbar=True
@@ -122,224 +214,246 @@ def create_dashboard(trade_bot):
         ])
     
     # Home dashboard layout (overview)
-    home_layout = dbc.Container([
-        # Status and controls row
-        dbc.Row([
-            # Bot status card
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Bot Status"),
-                    dbc.CardBody([
-                        html.Div([
-                            daq.PowerButton(
-                                id='power-button',
-                                on=False,
-                                color='#00FF00',
-                                size=48
-                            ),
-                            html.Div(id='bot-status-text', children="Stopped", className='ms-3')
-                        ], className='d-flex align-items-center')
-                    ])
-                ], className='h-100')
-            ], width=3),
-            
-            # Account info card
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Account Information"),
-                    dbc.CardBody([
-                        html.Div([
+    def create_home_layout():
+        return dbc.Container([
+            # Status and controls row
+            dbc.Row([
+                # Bot status card
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Bot Status"),
+                        dbc.CardBody([
                             html.Div([
-                                html.P("Available Margin", className='stat-label'),
-                                html.H3(id='available-margin', children="₹0.00", className='stat-value')
-                            ], className='stat-item'),
-                            html.Div([
-                                html.P("Used Margin", className='stat-label'),
-                                html.H3(id='used-margin', children="₹0.00", className='stat-value')
-                            ], className='stat-item'),
+                                daq.PowerButton(
+                                    id='power-button',
+                                    on=False,
+                                    color='#00FF00',
+                                    size=48
+                                ),
+                                html.Div(id='bot-status-text', children="Stopped", className='ms-3')
+                            ], className='d-flex align-items-center')
+                        ])
+                    ], className='h-100')
+                ], width=3),
+                
+                # Account info card
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Account Information"),
+                        dbc.CardBody([
                             html.Div([
-                                html.P("Active Trades", className='stat-label'),
-                                html.H3(id='active-trades-count', children="0", className='stat-value')
-                            ], className='stat-item')
-                        ], className='d-flex justify-content-between')
-                    ])
-                ], className='h-100')
-            ], width=9)
-        ], className='mb-4'),
-        
-        # Performance metrics row
-        dbc.Row([
-            # P&L card
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Today's P&L"),
-                    dbc.CardBody([
-                        html.H2(id='today-pnl', children="₹0.00", className='metric-value'),
-                        html.P(id='today-pnl-percent', children="0.00%", className='metric-change')
-                    ], className='text-center')
-                ], className='h-100 metric-card')
-            ], width=3),
+                                html.Div([
+                                    html.P("Available Margin", className='stat-label'),
+                                    html.H3(id='available-margin', children="₹0.00", className='stat-value')
+                                ], className='stat-item'),
+                                html.Div([
+                                    html.P("Used Margin", className='stat-label'),
+                                    html.H3(id='used-margin', children="₹0.00", className='stat-value')
+                                ], className='stat-item'),
+                                html.Div([
+                                    html.P("Active Trades", className='stat-label'),
+                                    html.H3(id='active-trades-count', children="0", className='stat-value')
+                                ], className='stat-item')
+                            ], className='d-flex justify-content-between')
+                        ])
+                    ], className='h-100')
+                ], width=9)
+            ], className='mb-4'),
             
-            # Win rate card
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Win Rate"),
-                    dbc.CardBody([
-                        html.H2(id='win-rate', children="0%", className='metric-value'),
-                        html.P(id='win-rate-trades', children="0/0 trades", className='metric-change')
-                    ], className='text-center')
-                ], className='h-100 metric-card')
-            ], width=3),
+            # Performance metrics row
+            dbc.Row([
+                # P&L card
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Today's P&L"),
+                        dbc.CardBody([
+                            html.H2(id='today-pnl', children="₹0.00", className='metric-value'),
+                            html.P(id='today-pnl-percent', children="0.00%", className='metric-change')
+                        ], className='text-center')
+                    ], className='h-100 metric-card')
+                ], width=3),
+                
+                # Win rate card
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Win Rate"),
+                        dbc.CardBody([
+                            html.H2(id='win-rate', children="0%", className='metric-value'),
+                            html.P(id='win-rate-trades', children="0/0 trades", className='metric-change')
+                        ], className='text-center')
+                    ], className='h-100 metric-card')
+                ], width=3),
+                
+                # Avg profit card
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Avg. Profit"),
+                        dbc.CardBody([
+                            html.H2(id='avg-profit', children="₹0.00", className='metric-value'),
+                            html.P(id='avg-profit-percent', children="0.00%", className='metric-change')
+                        ], className='text-center')
+                    ], className='h-100 metric-card')
+                ], width=3),
+                
+                # Avg loss card
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Avg. Loss"),
+                        dbc.CardBody([
+                            html.H2(id='avg-loss', children="₹0.00", className='metric-value'),
+                            html.P(id='avg-loss-percent', children="0.00%", className='metric-change')
+                        ], className='text-center')
+                    ], className='h-100 metric-card')
+                ], width=3)
+            ], className='mb-4'),
             
-            # Avg profit card
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Avg. Profit"),
-                    dbc.CardBody([
-                        html.H2(id='avg-profit', children="₹0.00", className='metric-value'),
-                        html.P(id='avg-profit-percent', children="0.00%", className='metric-change')
-                    ], className='text-center')
-                ], className='h-100 metric-card')
-            ], width=3),
+            # Charts row
+            dbc.Row([
+                # P&L chart
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("P&L History"),
+                        dbc.CardBody([
+                            dcc.Graph(
+                                id='pnl-chart',
+                                config={'displayModeBar': False},
+                                className='chart'
+                            )
+                        ])
+                    ], className='h-100')
+                ], width=8),
+                
+                # Trade distribution
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader("Trade Distribution"),
+                        dbc.CardBody([
+                            dcc.Graph(
+                                id='trade-distribution',
+                                config={'displayModeBar': False},
+                                className='chart'
+                            )
+                        ])
+                    ], className='h-100')
+                ], width=4)
+            ], className='mb-4'),
             
-            # Avg loss card
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Avg. Loss"),
-                    dbc.CardBody([
-                        html.H2(id='avg-loss', children="₹0.00", className='metric-value'),
-                        html.P(id='avg-loss-percent', children="0.00%", className='metric-change')
-                    ], className='text-center')
-                ], className='h-100 metric-card')
-            ], width=3)
-        ], className='mb-4'),
-        
-        # Charts row
-        dbc.Row([
-            # P&L chart
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("P&L History"),
-                    dbc.CardBody([
-                        dcc.Graph(
-                            id='pnl-chart',
-                            config={'displayModeBar': False},
-                            className='chart'
-                        )
+            # Active trades table
+            dbc.Row([
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader([
+                            html.Span("Active Trades", className="h5"),
+                            dbc.Button(
+                                [html.I(className="fas fa-external-link-alt me-2"), "View All"],
+                                href="/trades",
+                                color="link",
+                                size="sm",
+                                className="float-end"
+                            )
+                        ]),
+                        dbc.CardBody([
+                            html.P("No active trades", id='active-trades-empty', className='d-none'),
+                            # Virtualized, so only the visible rows are rendered
+                            dash_table.DataTable(
+                                id='active-trades-grid',
+                                columns=ACTIVE_TRADE_COLUMNS,
+                                data=[],
+                                virtualization=True,
+                                fixed_rows={'headers': True},
+                                page_action='none',
+                                style_table={'height': '300px', 'overflowY': 'auto'},
+                                **TABLE_STYLE
+                            )
+                        ])
                     ])
-                ], className='h-100')
-            ], width=8),
+                ], width=12)
+            ], className='mb-4'),
             
-            # Trade distribution
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader("Trade Distribution"),
-                    dbc.CardBody([
-                        dcc.Graph(
-                            id='trade-distribution',
-                            config={'displayModeBar': False},
-                            className='chart'
-                        )
-                    ])
-                ], className='h-100')
-            ], width=4)
-        ], className='mb-4'),
-        
-        # Active trades table
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader([
-                        html.Span("Active Trades", className="h5"),
-                        dbc.Button(
-                            [html.I(className="fas fa-external-link-alt me-2"), "View All"],
-                            href="/trades",
-                            color="link",
-                            size="sm",
-                            className="float-end"
-                        )
-                    ]),
-                    dbc.CardBody([
-                        html.Div(id='active-trades-table')
-                    ])
-                ])
-            ], width=12)
-        ], className='mb-4'),
-        
-        # Trade history
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardHeader([
-                        html.Span("Recent Trade History", className="h5"),
-                        dbc.Button(
-                            [html.I(className="fas fa-external-link-alt me-2"), "View All"],
-                            href="/trades",
-                            color="link",
-                            size="sm",
-                            className="float-end"
-                        )
-                    ]),
-                    dbc.CardBody([
-                        html.Div(id='trade-history-table')
+            # Trade history
+            dbc.Row([
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardHeader([
+                            html.Span("Recent Trade History", className="h5"),
+                            dbc.Button(
+                                [html.I(className="fas fa-external-link-alt me-2"), "View All"],
+                                href="/trades",
+                                color="link",
+                                size="sm",
+                                className="float-end"
+                            )
+                        ]),
+                        dbc.CardBody([
+                            html.P("No trade history", id='trade-history-empty', className='d-none'),
+                            dash_table.DataTable(
+                                id='trade-history-grid',
+                                columns=TRADE_HISTORY_COLUMNS,
+                                data=[],
+                                **TABLE_STYLE
+                            )
+                        ])
                     ])
-                ])
-            ], width=12)
-        ])
-    ], fluid=True)
+                ], width=12)
+            ])
+        ], fluid=True)
+    
+    # Authentication redirects are plain Flask routes, they need no Dash round-trip
+    @app.server.route('/login/callback')
+    def login_callback():
+        # Handle Zerodha callback
+        request_token = request.args.get('request_token')
+        if request_token and trade_bot.login(request_token):
+            return redirect('/')
+        
+        return redirect('/login')
+    
+    @app.server.route('/login/demo-callback')
+    def demo_login_callback():
+        # Handle demo login
+        if trade_bot.login("demo_token"):
+            return redirect('/')
+        
+        return redirect('/login')
+    
+    @app.server.route('/logout')
+    def logout():
+        # In a real app, you would clear the session
+        return redirect('/login')
     
     # Route to different pages
     @app.callback(
-        Output('page-content', 'children'),
-        Input('url', 'pathname')
+        [Output('page-content', 'children'),
+         Output('auth-state', 'data')],
+        Input('url', 'pathname'),
+        State('auth-state', 'data')
     )
-    def display_page(pathname):
-        if pathname == '/login/callback':
-            # Handle Zerodha callback
-            request_token = request.args.get('request_token')
-            if request_token:
-                success = trade_bot.login(request_token)
-                if success:
-                    return redirect('/')
-            
-            return login_layout
-        
-        elif pathname == '/login/demo-callback':
-            # Handle demo login
-            success = trade_bot.login("demo_token")
-            if success:
-                return redirect('/')
-            
-            return login_layout
-        
-        elif pathname == '/logout':
-            # Handle logout
-            # In a real app, you would clear the session
-            return redirect('/login')
-        
-        elif trade_bot.is_authenticated():
+    def display_page(pathname, auth_state):
+        if trade_bot.is_authenticated():
             # Show appropriate page based on pathname
             main_layout = create_main_layout()
             
             if pathname == '/trades':
                 page_content = create_trades_layout(trade_bot)
-                return html.Div([main_layout, html.Div(page_content, id="page-layout")])
             elif pathname == '/strategies':
                 page_content = create_strategies_layout(trade_bot)
-                return html.Div([main_layout, html.Div(page_content, id="page-layout")])
             elif pathname == '/analytics':
                 page_content = create_analytics_layout(trade_bot)
-                return html.Div([main_layout, html.Div(page_content, id="page-layout")])
             elif pathname == '/settings':
                 page_content = create_settings_layout(trade_bot)
-                return html.Div([main_layout, html.Div(page_content, id="page-layout")])
             else:
                 # Default to home dashboard
-                return html.Div([main_layout, html.Div(home_layout, id="page-layout")])
+                page_content = create_home_layout()
+            
+            return html.Div([main_layout, html.Div(page_content, id="page-layout")]), 'app'
+        
+        elif auth_state == 'login':
+            # The login page is already showing, every path renders the same view
+            return no_update, no_update
         
         else:
             # Show login page if not authenticated
-            return login_layout
+            return create_login_layout(), 'login'
     
     # Login button callback
     @app.callback(
@@ -373,42 +487,90 @@ def create_dashboard(trade_bot):
     # Power button callback
     @app.callback(
         [Output('bot-status-text', 'children'),
-         Output('bot-status-text', 'className')],
+         Output('bot-status-text', 'className'),
+         Output('bot-running-store', 'data')],
         Input('power-button', 'on')
     )
     def toggle_bot(on):
         if on:
             success = trade_bot.start()
             if success:
-                return "Running", "ms-3 text-success"
+                return "Running", "ms-3 text-success", True
             else:
-                return "Error", "ms-3 text-danger"
+                return "Error", "ms-3 text-danger", False
         else:
             trade_bot.stop()
-            return "Stopped", "ms-3 text-danger"
+            return "Stopped", "ms-3 text-danger", False
+    
+    # Refresh quickly while the bot trades, slowly when it is stopped or the tab is hidden
+    app.clientside_callback(
+        ClientsideFunction(namespace='zerobot', function_name='adaptInterval'),
+        Output('interval-component', 'interval'),
+        Input('bot-running-store', 'data'),
+        State('refresh-intervals', 'data')
+    )
+    
+    def _history_points(trades):
+        """Reduce closed trades to the (timestamp, pnl) points the browser charts"""
+        return [
+            {'timestamp': trade['sell_timestamp'].isoformat(), 'pnl': float(trade['pnl'])}
+            for trade in trades
+        ]
+    
+    # Fetch everything the overview shows once per refresh
+    @app.callback(
+        [Output('app-state', 'data'),
+         Output('trade-history-store', 'data')],
+        Input('interval-component', 'n_intervals'),
+        [State('app-state', 'data'),
+         State('trade-history-store', 'data')]
+    )
+    def update_app_state(n, stored_state, stored_history):
+        margins = _cached_margins()
+        trade_history = _cached_trade_history()
+        
+        state = {
+            'metrics': dict(_cached_metrics()),
+            'capital': trade_bot.capital,
+            'margins': {
+                'available': margins['equity']['available']['cash'] if margins else 0,
+                'used': margins['equity']['utilised']['debits'] if margins else 0
+            },
+            'active_trades': len(_cached_active_trades()),
+            'positions': _cached_positions()['day'].to_dict('records')
+        }
+        
+        # Unchanged state leaves every dependent callback idle
+        state_update = no_update if state == stored_state else state
+        
+        # Trade history only grows, so send just the trades the browser hasn't seen
+        # (the browser can hold more after a restart, then the store is rebuilt)
+        known = len(stored_history) if stored_history is not None else -1
+        if known == len(trade_history):
+            history_update = no_update
+        elif 0 <= known < len(trade_history):
+            history_update = Patch()
+            history_update.extend(_history_points(trade_history[known:]))
+        else:
+            history_update = _history_points(trade_history)
+        
+        return state_update, history_update
     
     # Update account info
     @app.callback(
         [Output('available-margin', 'children'),
          Output('used-margin', 'children'),
          Output('active-trades-count', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('app-state', 'data')
     )
-    def update_account_info(n):
-        # Get margin information
-        margins = trade_bot.get_margins()
+    def update_account_info(state):
+        # The state store is empty until the first refresh fills it
+        if state is None:
+            raise PreventUpdate
         
-        if margins:
-            available = margins['equity']['available']['cash']
-            used = margins['equity']['utilised']['debits']
-        else:
-            available = 0
-            used = 0
-        
-        # Get active trades count
-        active_trades = len(trade_bot.get_active_trades())
+        margins = state['margins']
         
-        return f"₹{available:,.2f}", f"₹{used:,.2f}", str(active_trades)
+        return format_money(margins['available']), format_money(margins['used']), str(state['active_trades'])
     
     # Update performance metrics
     @app.callback(
@@ -421,311 +583,123 @@ def create_dashboard(trade_bot):
          Output('avg-profit-percent', 'children'),
          Output('avg-loss', 'children'),
          Output('avg-loss-percent', 'children')],
-        Input('interval-component', 'n_intervals')
+        Input('app-state', 'data')
     )
-    def update_metrics(n):
-        # Get metrics
-        metrics = trade_bot.get_metrics()
+    def update_metrics(state):
+        if state is None:
+            raise PreventUpdate
+        
+        metrics = state['metrics']
+        capital = state['capital']
         
         # Calculate values
         net_pnl = metrics['net_pnl']
-        pnl_percent = (net_pnl / trade_bot.capital) * 100 if trade_bot.capital > 0 else 0
+        pnl_percent = (net_pnl / capital) * 100 if capital > 0 else 0
         
         win_rate = metrics['win_rate']
         total_trades = metrics['total_trades']
         winning_trades = metrics['winning_trades']
         
         avg_profit = metrics['avg_profit']
-        avg_profit_percent = (avg_profit / trade_bot.capital) * 100 if trade_bot.capital > 0 else 0
+        avg_profit_percent = (avg_profit / capital) * 100 if capital > 0 else 0
         
         avg_loss = metrics['avg_loss']
-        avg_loss_percent = (avg_loss / trade_bot.capital) * 100 if trade_bot.capital > 0 else 0
+        avg_loss_percent = (avg_loss / capital) * 100 if capital > 0 else 0
         
         # Determine classes for styling
         pnl_class = 'metric-change text-success' if net_pnl >= 0 else 'metric-change text-danger'
         pnl_value_class = 'metric-value text-success' if net_pnl >= 0 else 'metric-value text-danger'
         
         return (
-            f"₹{net_pnl:,.2f}",
+            format_money(net_pnl),
             pnl_class,
             pnl_value_class,
-            f"{win_rate:.2f}%",
+            format_percent(win_rate),
             f"{winning_trades}/{total_trades} trades",
-            f"₹{avg_profit:,.2f}",
-            f"{avg_profit_percent:.2f}%",
-            f"₹{avg_loss:,.2f}",
-            f"{avg_loss_percent:.2f}%"
+            format_money(avg_profit),
+            format_percent(avg_profit_percent),
+            format_money(avg_loss),
+            format_percent(avg_loss_percent)
         )
     
-    # Update P&L chart
-    @app.callback(
+    # P&L and distribution charts are built in the browser (assets/zerobot.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace='zerobot', function_name='buildPnlChart'),
         Output('pnl-chart', 'figure'),
-        Input('interval-component', 'n_intervals')
+        Input('trade-history-store', 'data')
     )
-    def update_pnl_chart(n):
-        # Get trade history
-        trade_history = trade_bot.get_trade_history()
-        
-        if not trade_history:
-            # Return empty chart if no trades
-            return {
-                'data': [],
-                'layout': {
-                    'paper_bgcolor': 'rgba(0,0,0,0)',
-                    'plot_bgcolor': 'rgba(0,0,0,0)',
-                    'xaxis': {'showgrid': False},
-                    'yaxis': {'showgrid': False},
-                    'annotations': [{
-                        'text': 'No trade data available',
-                        'xref': 'paper',
-                        'yref': 'paper',
-                        'showarrow': False,
-                        'font': {'size': 20, 'color': 'white'}
-                    }]
-                }
-            }
-        
-        # Create dataframe from trade history
-        df = pd.DataFrame(trade_history)
-        df['timestamp'] = pd.to_datetime(df['sell_timestamp'])
-        df = df.sort_values('timestamp')
-        
-        # Calculate cumulative P&L
-        df['cumulative_pnl'] = df['pnl'].cumsum()
-        
-        # Create the figure
-        fig = go.Figure()
-        
-        # Add the line
-        fig.add_trace(go.Scatter(
-            x=df['timestamp'],
-            y=df['cumulative_pnl'],
-            mode='lines+markers',
-            name='P&L',
-            line={'width': 3, 'color': '#00FF00'},
-            marker={'size': 8, 'color': '#00FF00'}
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
-            xaxis={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': None
-            },
-            yaxis={
-                'showgrid': True,
-                'gridcolor': '#444',
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': None,
-                'tickprefix': '₹'
-            },
-            hovermode='x unified'
-        )
-        
-        return fig
     
-    # Update trade distribution chart
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace='zerobot', function_name='buildTradeDistribution'),
         Output('trade-distribution', 'figure'),
-        Input('interval-component', 'n_intervals')
+        Input('app-state', 'data')
     )
-    def update_trade_distribution(n):
-        # Get metrics
-        metrics = trade_bot.get_metrics()
-        
-        # Get values
-        winning_trades = metrics['winning_trades']
-        losing_trades = metrics['losing_trades']
-        
-        if winning_trades == 0 and losing_trades == 0:
-            # Return empty chart if no trades
-            return {
-                'data': [],
-                'layout': {
-                    'paper_bgcolor': 'rgba(0,0,0,0)',
-                    'plot_bgcolor': 'rgba(0,0,0,0)',
-                    'xaxis': {'showgrid': False},
-                    'yaxis': {'showgrid': False},
-                    'annotations': [{
-                        'text': 'No trade data available',
-                        'xref': 'paper',
-                        'yref': 'paper',
-                        'showarrow': False,
-                        'font': {'size': 20, 'color': 'white'}
-                    }]
-                }
-            }
-        
-        # Create the figure
-        fig = go.Figure()
-        
-        # Add the pie chart
-        fig.add_trace(go.Pie(
-            labels=['Winning Trades', 'Losing Trades'],
-            values=[winning_trades, losing_trades],
-            marker={'colors': ['#00FF00', '#FF0000']},
-            textinfo='percent',
-            hole=0.6
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 20, 'r': 20, 't': 20, 'b': 20},
-            showlegend=True,
-            legend={
-                'orientation': 'h',
-                'yanchor': 'bottom',
-                'y': -0.2,
-                'xanchor': 'center',
-                'x': 0.5
-            }
-        )
-        
-        return fig
     
     # Update active trades table
     @app.callback(
-        Output('active-trades-table', 'children'),
-        Input('interval-component', 'n_intervals')
+        [Output('active-trades-grid', 'data'),
+         Output('active-trades-empty', 'className')],
+        Input('app-state', 'data')
     )
-    def update_active_trades_table(n):
-        # Get active trades from simulation engine
-        simulation_engine = get_simulation_engine()
-        positions = simulation_engine.get_positions()
-
-        if positions['day'].empty:
-            return html.P("No active trades", className='text-center text-muted my-3')
-
-        # Create table rows
+    def update_active_trades_table(state):
+        if state is None:
+            raise PreventUpdate
+        
+        # Active trades come from the simulation engine positions
+        positions = state['positions']
+        
+        if not positions:
+            return [], 'text-center text-muted my-3'
+        
         rows = []
-        for _, position in positions['day'].iterrows():
-            symbol = position['tradingsymbol']
-            exchange = position['exchange']
+        for position in positions:
             quantity = position['quantity']
             buy_price = position['average_price']
-            current_price = position['last_price']
             pnl = position['pnl']
-            pnl_percent = (pnl / (buy_price * quantity)) * 100 if buy_price * quantity > 0 else 0
-
-            # Determine class for styling
-            pnl_class = 'text-success' if pnl >= 0 else 'text-danger'
-
-            # Create row
-            row = html.Tr([
-                html.Td(f"{exchange}:{symbol}"),
-                html.Td(f"{quantity}"),
-                html.Td(f"₹{buy_price:.2f}"),
-                html.Td(f"₹{current_price:.2f}"),
-                html.Td(f"₹{pnl:.2f}", className=pnl_class),
-                html.Td(f"{pnl_percent:.2f}%", className=pnl_class),
-                html.Td(
-                    dbc.Button("Close", color="danger", size="sm", id={'type': 'close-trade-button', 'index': f"{exchange}:{symbol}"})
-                )
-            ])
-
-            rows.append(row)
-        
-        # Create table
-        table = dbc.Table(
-            [
-                html.Thead(
-                    html.Tr([
-                        html.Th("Symbol"),
-                        html.Th("Quantity"),
-                        html.Th("Buy Price"),
-                        html.Th("Current Price"),
-                        html.Th("P&L"),
-                        html.Th("P&L %"),
-                        html.Th("Action")
-                    ])
-                ),
-                html.Tbody(rows)
-            ],
-            bordered=True,
-            hover=True,
-            responsive=True,
-            striped=True
-        )
-        
-        return table
+            
+            rows.append({
+                'symbol': f"{position['exchange']}:{position['tradingsymbol']}",
+                'quantity': quantity,
+                'buy_price': buy_price,
+                'current_price': position['last_price'],
+                'pnl': pnl,
+                'pnl_percent': (pnl / (buy_price * quantity)) * 100 if buy_price * quantity > 0 else 0
+            })
+        
+        return rows, 'd-none'
     
-    # Update trade history table
+    # Update trade history table (only when the history store changes)
     @app.callback(
-        Output('trade-history-table', 'children'),
-        Input('interval-component', 'n_intervals')
+        [Output('trade-history-grid', 'data'),
+         Output('trade-history-empty', 'className')],
+        Input('trade-history-store', 'data')
     )
-    def update_trade_history_table(n):
-        # Get trade history
-        trade_history = trade_bot.get_trade_history()
+    def update_trade_history_table(stored_history):
+        # Only the 5 most recent trades are shown
+        recent_trades = trade_bot.get_recent_trade_history(5)
         
-        if not trade_history:
-            return html.P("No trade history", className='text-center text-muted my-3')
+        if not recent_trades:
+            return [], 'text-center text-muted my-3'
         
-        # Create table rows
         rows = []
-        for trade in trade_history[:5]:  # Only show the 5 most recent trades
+        for trade in recent_trades:
             instrument = trade['instrument']
-            symbol = instrument['tradingsymbol']
-            exchange = instrument['exchange']
             quantity = trade['quantity']
             buy_price = trade['buy_price']
-            sell_price = trade['sell_price']
             pnl = trade['pnl']
-            pnl_percent = (pnl / (buy_price * quantity)) * 100
-            timestamp = trade['sell_timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-            reason = trade['reason'].capitalize()
-            
-            # Determine class for styling
-            pnl_class = 'text-success' if pnl >= 0 else 'text-danger'
             
-            # Create row
-            row = html.Tr([
-                html.Td(f"{exchange}:{symbol}"),
-                html.Td(f"{quantity}"),
-                html.Td(f"₹{buy_price:.2f}"),
-                html.Td(f"₹{sell_price:.2f}"),
-                html.Td(f"₹{pnl:.2f}", className=pnl_class),
-                html.Td(f"{pnl_percent:.2f}%", className=pnl_class),
-                html.Td(reason),
-                html.Td(timestamp)
-            ])
-            
-            rows.append(row)
-        
-        # Create table
-        table = dbc.Table(
-            [
-                html.Thead(
-                    html.Tr([
-                        html.Th("Symbol"),
-                        html.Th("Quantity"),
-                        html.Th("Buy Price"),
-                        html.Th("Sell Price"),
-                        html.Th("P&L"),
-                        html.Th("P&L %"),
-                        html.Th("Reason"),
-                        html.Th("Timestamp")
-                    ])
-                ),
-                html.Tbody(rows)
-            ],
-            bordered=True,
-            hover=True,
-            responsive=True,
-            striped=True
-        )
-        
-        return table
+            rows.append({
+                'symbol': f"{instrument['exchange']}:{instrument['tradingsymbol']}",
+                'quantity': quantity,
+                'buy_price': buy_price,
+                'sell_price': trade['sell_price'],
+                'pnl': pnl,
+                'pnl_percent': (pnl / (buy_price * quantity)) * 100,
+                'reason': trade['reason'].capitalize(),
+                'timestamp': trade['sell_timestamp'].strftime('%Y-%m-%d %H:%M:%S')
+            })
+        
+        return rows, 'd-none'
     
     # Register callbacks for each page
     register_trades_callbacks(app, trade_bot)
@@ -0,0 +1,12 @@
+"""
+Display formatting helpers for the ZeroBot dashboard
+"""
+
+# Bound str.format methods, so table builders can map them over whole columns
+format_money = "₹{:,.2f}".format  # Totals, with thousands separators
+format_price = "₹{:.2f}".format  # Table cells
+format_percent = "{:.2f}%".format
+
+def format_column(values, formatter):
+    """Format a column of numbers (list, array or Series) into strings"""
+    return list(map(formatter, values.tolist() if hasattr(values, 'tolist') else values))
@@ -1,14 +1,19 @@
 """
 Analytics page for the ZeroBot dashboard
 """
+from functools import lru_cache
 import dash
-from dash import dcc, html, callback, Input, Output, State
+from dash import dcc, html, callback, Input, Output, State, ClientsideFunction, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
-import plotly.express as px
-import pandas as pd
+import plotly.io as pio
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from src.dashboard.caching import ttl_memoize
+from src.dashboard.formatting import format_price, format_percent, format_column
+
+# Seconds a date-dependent analytics figure is reused across refreshes
+ANALYTICS_CACHE_TIMEOUT = 60
 
 def create_analytics_layout(trade_bot):
     """Create the analytics page layout"""
@@ -71,7 +76,8 @@ def create_analytics_layout(trade_bot):
                             id="market-index-chart",
                             config={"displayModeBar": False},
                             style={"height": "300px"}
-                        )
+                        ),
+                        dcc.Store(id="market-figs-store")
                     ])
                 ], className="mb-4")
             ], width=8),
@@ -211,114 +217,254 @@ def create_analytics_layout(trade_bot):
     
     return layout
 
+# Dark chart styling shared by the analytics figures
+_DARK_LAYOUT = {'paper_bgcolor': 'rgba(0,0,0,0)', 'plot_bgcolor': 'rgba(0,0,0,0)'}
+_CHART_MARGIN = {'l': 40, 'r': 40, 't': 10, 'b': 40}
+_DARK_XAXIS = {'showgrid': False, 'showline': True, 'linecolor': '#444', 'linewidth': 1, 'title': None}
+_DARK_YAXIS = {'showgrid': True, 'gridcolor': '#444', 'showline': True, 'linecolor': '#444', 'linewidth': 1}
+_TOP_LEGEND = {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1}
+
+def _prejson(fig):
+    """Serialize a figure to a plain dict so Dash can skip validating it on every return"""
+    return pio.json.from_json_plotly(pio.to_json(fig))
+
+# Header shared by the top gainers and losers tables
+_MOVERS_HEAD = html.Thead(html.Tr([html.Th("Symbol"), html.Th("Price"), html.Th("Change")]))
+
+# Sample data for the top movers tables
+_GAINERS = [
+    {"symbol": "RELIANCE", "price": 2450.75, "change": 3.5},
+    {"symbol": "TCS", "price": 3750.50, "change": 2.8},
+    {"symbol": "INFY", "price": 1420.75, "change": 2.2},
+    {"symbol": "HDFCBANK", "price": 1650.25, "change": 1.9},
+    {"symbol": "ICICIBANK", "price": 950.80, "change": 1.7}
+]
+_LOSERS = [
+    {"symbol": "BHARTIARTL", "price": 850.25, "change": -2.1},
+    {"symbol": "ITC", "price": 420.50, "change": -1.8},
+    {"symbol": "HINDUNILVR", "price": 2520.75, "change": -1.5},
+    {"symbol": "KOTAKBANK", "price": 1750.30, "change": -1.3},
+    {"symbol": "SBIN", "price": 650.90, "change": -1.1}
+]
+
+def _build_movers_table(movers, arrow, class_name):
+    """Build a top movers table, marking each change with `arrow` in `class_name`"""
+    # Format the price and change columns in one pass each
+    prices = format_column([mover["price"] for mover in movers], format_price)
+    changes = format_column(np.abs([mover["change"] for mover in movers]), format_percent)
+    
+    # Create table rows
+    rows = [
+        html.Tr([
+            html.Td(mover["symbol"]),
+            html.Td(price),
+            html.Td(f"{arrow} {change}", className=class_name)
+        ])
+        for mover, price, change in zip(movers, prices, changes)
+    ]
+    
+    # Create table
+    table = dbc.Table(
+        [_MOVERS_HEAD, html.Tbody(rows)],
+        bordered=False,
+        hover=True,
+        responsive=True,
+        striped=True,
+        size="sm"
+    )
+    
+    return table
+
+def _build_trade_time_fig():
+    """Build the trades-per-hour bar chart"""
+    # Generate sample data
+    hours = list(range(9, 16))  # Trading hours: 9 AM to 3 PM
+    trades = [15, 22, 18, 25, 30, 20, 10]  # Number of trades per hour
+    
+    # Create figure
+    fig = go.Figure(go.Bar(
+        x=hours,
+        y=trades,
+        marker={'color': '#00FF00'},
+        hovertemplate='Hour of Day=%{x}<br>Number of Trades=%{y}<extra></extra>'
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        **_DARK_LAYOUT,
+        margin=_CHART_MARGIN,
+        xaxis={**_DARK_XAXIS, 'title': 'Hour of Day', 'tickvals': hours, 'ticktext': [f"{h}:00" for h in hours]},
+        yaxis={**_DARK_YAXIS, 'title': 'Number of Trades'}
+    )
+    
+    return fig
+
+def _build_trade_symbol_fig():
+    """Build the trades-per-symbol pie chart"""
+    # Generate sample data
+    symbols = ["RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK"]
+    trades = [35, 28, 22, 18, 15]  # Number of trades per symbol
+    
+    # Create figure
+    fig = go.Figure(go.Pie(
+        labels=symbols,
+        values=trades,
+        marker={'colors': ['#00FF00', '#00CCFF', '#FF9900', '#FF00FF', '#FFFF00']}
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        **_DARK_LAYOUT,
+        margin={'l': 10, 'r': 10, 't': 10, 'b': 10},
+        legend={
+            'orientation': 'h',
+            'yanchor': 'bottom',
+            'y': -0.2,
+            'xanchor': 'center',
+            'x': 0.5
+        }
+    )
+    
+    return fig
+
+def _build_correlation_fig():
+    """Build the sample correlation heatmap"""
+    # Generate sample correlation data
+    symbols = ["NIFTY", "RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK", "BHARTIARTL", "ITC", "HINDUNILVR", "KOTAKBANK"]
+    
+    # Create a correlation matrix with random values
+    rng = np.random.default_rng(42)  # For reproducibility, without reseeding the global RNG
+    corr_matrix = rng.uniform(0.5, 1.0, size=(len(symbols), len(symbols)))
+    
+    # Make the matrix symmetric by mirroring the upper triangle in place
+    upper = np.triu_indices(len(symbols), k=1)
+    corr_matrix[upper[::-1]] = corr_matrix[upper]
+    
+    # Set diagonal to 1.0
+    np.fill_diagonal(corr_matrix, 1.0)
+    
+    # Create figure
+    fig = go.Figure(go.Heatmap(
+        z=corr_matrix,
+        x=symbols,
+        y=symbols,
+        colorscale='RdBu_r',
+        zmin=-1,
+        zmax=1,
+        colorbar={
+            'title': 'Correlation',
+            'thickness': 15,
+            'len': 0.5,
+            'y': 0.5
+        }
+    ))
+    
+    # Update layout, listing the first symbol at the top like a matrix
+    fig.update_layout(
+        **_DARK_LAYOUT,
+        margin={'l': 40, 'r': 40, 't': 40, 'b': 40},
+        yaxis={'autorange': 'reversed'}
+    )
+    
+    return fig
+
+# The sample tables and figures never change, so build and serialize them once at import
+_GAINERS_TABLE = _build_movers_table(_GAINERS, "▲", "text-success")
+_LOSERS_TABLE = _build_movers_table(_LOSERS, "▼", "text-danger")
+_TRADE_TIME_FIG = _prejson(_build_trade_time_fig())
+_TRADE_SYMBOL_FIG = _prejson(_build_trade_symbol_fig())
+_CORRELATION_FIG = _prejson(_build_correlation_fig())
+
+def _date_range_for(days, day):
+    """Daily dates for the `days` before calendar `day`, inclusive of both ends"""
+    return np.datetime64(day, 'D') - np.arange(days, -1, -1, dtype='timedelta64[D]')
+
+# Days of history shown by each market range button
+MARKET_RANGE_DAYS = {"market-1d": 1, "market-1w": 7, "market-1m": 30, "market-3m": 90}
+
+def _compute_market_index(days, day):
+    """Build the serialized index chart for the `days` before calendar `day`"""
+    # Generate sample data
+    dates = _date_range_for(days, day)
+    
+    # Generate NIFTY and SENSEX data as compounded random walks with slight
+    # positive drift, drawing both rows of changes at once
+    rng = np.random.default_rng(42)  # For reproducibility
+    bases = np.array([[22000], [73000]])
+    changes = rng.normal(0.05, 1.0, size=(2, len(dates) - 1)) / 100.0
+    nifty_prices, sensex_prices = bases * np.concatenate((np.ones((2, 1)), np.cumprod(1.0 + changes, axis=1)), axis=1)
+    
+    # Create figure
+    fig = go.Figure()
+    
+    # Add NIFTY line
+    fig.add_trace(go.Scattergl(
+        x=dates,
+        y=nifty_prices,
+        mode='lines',
+        name='NIFTY 50',
+        line={'width': 2, 'color': '#00FF00'}
+    ))
+    
+    # Add SENSEX line
+    fig.add_trace(go.Scattergl(
+        x=dates,
+        y=sensex_prices,
+        mode='lines',
+        name='SENSEX',
+        line={'width': 2, 'color': '#FF9900'},
+        yaxis="y2"
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        **_DARK_LAYOUT,
+        margin=_CHART_MARGIN,
+        xaxis=_DARK_XAXIS,
+        yaxis={**_DARK_YAXIS, 'title': 'NIFTY 50', 'side': 'left'},
+        yaxis2={**_DARK_XAXIS, 'title': 'SENSEX', 'side': 'right', 'overlaying': 'y'},
+        legend=_TOP_LEGEND
+    )
+    
+    return _prejson(fig)
+
+@lru_cache(maxsize=2)
+def _market_figures(day):
+    """Serialized index charts for every range button on calendar `day`, keyed by button id"""
+    return {button_id: _compute_market_index(days, day) for button_id, days in MARKET_RANGE_DAYS.items()}
+
 def register_analytics_callbacks(app, trade_bot):
     """Register callbacks for the analytics page"""
     
-    # Market Index Chart
+    # The range buttons only ever show these four figures, so build today's up front
+    _market_figures(datetime.now().date())
+    
+    # Market Index Chart figures for every range button, resent only when the date changes
     @app.callback(
+        Output("market-figs-store", "data"),
+        Input("interval-component", "n_intervals"),
+        State("market-figs-store", "data")
+    )
+    def update_market_figures(n, stored):
+        day = datetime.now().date()
+        if stored and stored['day'] == day.isoformat():
+            return no_update
+        
+        return {
+            'day': day.isoformat(),
+            'figures': _market_figures(day)
+        }
+    
+    # Switch ranges in the browser without a server roundtrip
+    app.clientside_callback(
+        ClientsideFunction(namespace='zerobot', function_name='pickMarketFigure'),
         Output("market-index-chart", "figure"),
         [Input("market-1d", "n_clicks"),
          Input("market-1w", "n_clicks"),
          Input("market-1m", "n_clicks"),
-         Input("market-3m", "n_clicks")]
+         Input("market-3m", "n_clicks"),
+         Input("market-figs-store", "data")]
     )
-    def update_market_index_chart(day_clicks, week_clicks, month_clicks, three_month_clicks):
-        # Determine which button was clicked
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            # Default to 1 month view
-            days = 30
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            if button_id == "market-1d":
-                days = 1
-            elif button_id == "market-1w":
-                days = 7
-            elif button_id == "market-1m":
-                days = 30
-            else:  # 3 months
-                days = 90
-        
-        # Generate sample data
-        dates = pd.date_range(start=datetime.now() - timedelta(days=days), end=datetime.now(), freq='D')
-        
-        # Generate NIFTY data
-        np.random.seed(42)  # For reproducibility
-        nifty_base = 22000
-        nifty_prices = [nifty_base]
-        for i in range(1, len(dates)):
-            change = np.random.normal(0.05, 1.0)  # Slight positive drift
-            nifty_prices.append(nifty_prices[-1] * (1 + change / 100))
-        
-        # Generate SENSEX data
-        sensex_base = 73000
-        sensex_prices = [sensex_base]
-        for i in range(1, len(dates)):
-            change = np.random.normal(0.05, 1.0)  # Slight positive drift
-            sensex_prices.append(sensex_prices[-1] * (1 + change / 100))
-        
-        # Create figure
-        fig = go.Figure()
-        
-        # Add NIFTY line
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=nifty_prices,
-            mode='lines',
-            name='NIFTY 50',
-            line={'width': 2, 'color': '#00FF00'}
-        ))
-        
-        # Add SENSEX line
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=sensex_prices,
-            mode='lines',
-            name='SENSEX',
-            line={'width': 2, 'color': '#FF9900'},
-            yaxis="y2"
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
-            xaxis={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': None
-            },
-            yaxis={
-                'showgrid': True,
-                'gridcolor': '#444',
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': 'NIFTY 50',
-                'side': 'left'
-            },
-            yaxis2={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': 'SENSEX',
-                'side': 'right',
-                'overlaying': 'y'
-            },
-            legend={
-                'orientation': 'h',
-                'yanchor': 'bottom',
-                'y': 1.02,
-                'xanchor': 'right',
-                'x': 1
-            }
-        )
-        
-        return fig
     
     # Top Gainers
     @app.callback(
@@ -326,51 +472,7 @@ def register_analytics_callbacks(app, trade_bot):
         Input("interval-component", "n_intervals")
     )
     def update_top_gainers(n):
-        # Generate sample data for top gainers
-        gainers = [
-            {"symbol": "RELIANCE", "price": 2450.75, "change": 3.5},
-            {"symbol": "TCS", "price": 3750.50, "change": 2.8},
-            {"symbol": "INFY", "price": 1420.75, "change": 2.2},
-            {"symbol": "HDFCBANK", "price": 1650.25, "change": 1.9},
-            {"symbol": "ICICIBANK", "price": 950.80, "change": 1.7}
-        ]
-        
-        # Create table rows
-        rows = []
-        for gainer in gainers:
-            symbol = gainer["symbol"]
-            price = gainer["price"]
-            change = gainer["change"]
-            
-            # Create row
-            row = html.Tr([
-                html.Td(symbol),
-                html.Td(f"₹{price:.2f}"),
-                html.Td(f"▲ {change:.2f}%", className="text-success")
-            ])
-            
-            rows.append(row)
-        
-        # Create table
-        table = dbc.Table(
-            [
-                html.Thead(
-                    html.Tr([
-                        html.Th("Symbol"),
-                        html.Th("Price"),
-                        html.Th("Change")
-                    ])
-                ),
-                html.Tbody(rows)
-            ],
-            bordered=False,
-            hover=True,
-            responsive=True,
-            striped=True,
-            size="sm"
-        )
-        
-        return table
+        return _GAINERS_TABLE
     
     # Top Losers
     @app.callback(
@@ -378,81 +480,31 @@ def register_analytics_callbacks(app, trade_bot):
         Input("interval-component", "n_intervals")
     )
     def update_top_losers(n):
-        # Generate sample data for top losers
-        losers = [
-            {"symbol": "BHARTIARTL", "price": 850.25, "change": -2.1},
-            {"symbol": "ITC", "price": 420.50, "change": -1.8},
-            {"symbol": "HINDUNILVR", "price": 2520.75, "change": -1.5},
-            {"symbol": "KOTAKBANK", "price": 1750.30, "change": -1.3},
-            {"symbol": "SBIN", "price": 650.90, "change": -1.1}
-        ]
-        
-        # Create table rows
-        rows = []
-        for loser in losers:
-            symbol = loser["symbol"]
-            price = loser["price"]
-            change = loser["change"]
-            
-            # Create row
-            row = html.Tr([
-                html.Td(symbol),
-                html.Td(f"₹{price:.2f}"),
-                html.Td(f"▼ {abs(change):.2f}%", className="text-danger")
-            ])
-            
-            rows.append(row)
-        
-        # Create table
-        table = dbc.Table(
-            [
-                html.Thead(
-                    html.Tr([
-                        html.Th("Symbol"),
-                        html.Th("Price"),
-                        html.Th("Change")
-                    ])
-                ),
-                html.Tbody(rows)
-            ],
-            bordered=False,
-            hover=True,
-            responsive=True,
-            striped=True,
-            size="sm"
-        )
-        
-        return table
+        return _LOSERS_TABLE
     
     # Performance Chart
-    @app.callback(
-        Output("performance-chart", "figure"),
-        Input("interval-component", "n_intervals")
-    )
-    def update_performance_chart(n):
+    @ttl_memoize(ANALYTICS_CACHE_TIMEOUT)
+    def build_performance_chart():
         # Generate sample data
-        dates = pd.date_range(start=datetime.now() - timedelta(days=90), end=datetime.now(), freq='D')
+        dates = _date_range_for(90, datetime.now().date())
+        
+        # Draw portfolio and benchmark changes together: the portfolio has a
+        # positive drift and the benchmark a smaller one
+        rng = np.random.default_rng(42)  # For reproducibility
+        changes = rng.normal([[0.1], [0.05]], [[1.2], [1.0]], size=(2, len(dates) - 1)) / 100.0
+        growth = np.concatenate((np.ones((2, 1)), np.cumprod(1.0 + changes, axis=1)), axis=1)
         
-        # Generate portfolio value data
-        np.random.seed(42)  # For reproducibility
         portfolio_base = 100000
-        portfolio_values = [portfolio_base]
-        for i in range(1, len(dates)):
-            change = np.random.normal(0.1, 1.2)  # Positive drift
-            portfolio_values.append(portfolio_values[-1] * (1 + change / 100))
+        portfolio_values = portfolio_base * growth[0]
         
-        # Generate benchmark data
         benchmark_base = 100000
-        benchmark_values = [benchmark_base]
-        for i in range(1, len(dates)):
-            change = np.random.normal(0.05, 1.0)  # Smaller positive drift
-            benchmark_values.append(benchmark_values[-1] * (1 + change / 100))
+        benchmark_values = benchmark_base * growth[1]
         
         # Create figure
         fig = go.Figure()
         
         # Add portfolio line
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=portfolio_values,
             mode='lines',
@@ -461,7 +513,7 @@ def register_analytics_callbacks(app, trade_bot):
         ))
         
         # Add benchmark line
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=benchmark_values,
             mode='lines',
@@ -471,34 +523,21 @@ def register_analytics_callbacks(app, trade_bot):
         
         # Update layout
         fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
-            xaxis={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': None
-            },
-            yaxis={
-                'showgrid': True,
-                'gridcolor': '#444',
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': 'Portfolio Value (₹)'
-            },
-            legend={
-                'orientation': 'h',
-                'yanchor': 'bottom',
-                'y': 1.02,
-                'xanchor': 'right',
-                'x': 1
-            }
+            **_DARK_LAYOUT,
+            margin=_CHART_MARGIN,
+            xaxis=_DARK_XAXIS,
+            yaxis={**_DARK_YAXIS, 'title': 'Portfolio Value (₹)'},
+            legend=_TOP_LEGEND
         )
         
-        return fig
+        return _prejson(fig)
+    
+    @app.callback(
+        Output("performance-chart", "figure"),
+        Input("interval-component", "n_intervals")
+    )
+    def update_performance_chart(n):
+        return build_performance_chart()
     
     # Trade Time Distribution
     @app.callback(
@@ -506,43 +545,7 @@ def register_analytics_callbacks(app, trade_bot):
         Input("interval-component", "n_intervals")
     )
     def update_trade_time_distribution(n):
-        # Generate sample data
-        hours = list(range(9, 16))  # Trading hours: 9 AM to 3 PM
-        trades = [15, 22, 18, 25, 30, 20, 10]  # Number of trades per hour
-        
-        # Create figure
-        fig = px.bar(
-            x=hours,
-            y=trades,
-            labels={'x': 'Hour of Day', 'y': 'Number of Trades'},
-            color_discrete_sequence=['#00FF00']
-        )
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
-            xaxis={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': 'Hour of Day',
-                'tickvals': hours,
-                'ticktext': [f"{h}:00" for h in hours]
-            },
-            yaxis={
-                'showgrid': True,
-                'gridcolor': '#444',
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': 'Number of Trades'
-            }
-        )
-        
-        return fig
+        return _TRADE_TIME_FIG
     
     # Trade Symbol Distribution
     @app.callback(
@@ -550,32 +553,7 @@ def register_analytics_callbacks(app, trade_bot):
         Input("interval-component", "n_intervals")
     )
     def update_trade_symbol_distribution(n):
-        # Generate sample data
-        symbols = ["RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK"]
-        trades = [35, 28, 22, 18, 15]  # Number of trades per symbol
-        
-        # Create figure
-        fig = px.pie(
-            names=symbols,
-            values=trades,
-            color_discrete_sequence=['#00FF00', '#00CCFF', '#FF9900', '#FF00FF', '#FFFF00']
-        )
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 10, 'r': 10, 't': 10, 'b': 10},
-            legend={
-                'orientation': 'h',
-                'yanchor': 'bottom',
-                'y': -0.2,
-                'xanchor': 'center',
-                'x': 0.5
-            }
-        )
-        
-        return fig
+        return _TRADE_SYMBOL_FIG
     
     # Correlation Matrix
     @app.callback(
@@ -583,41 +561,4 @@ def register_analytics_callbacks(app, trade_bot):
         Input("interval-component", "n_intervals")
     )
     def update_correlation_matrix(n):
-        # Generate sample correlation data
-        symbols = ["NIFTY", "RELIANCE", "TCS", "INFY", "HDFCBANK", "ICICIBANK", "BHARTIARTL", "ITC", "HINDUNILVR", "KOTAKBANK"]
-        
-        # Create a correlation matrix with random values
-        np.random.seed(42)  # For reproducibility
-        corr_matrix = np.random.uniform(0.5, 1.0, size=(len(symbols), len(symbols)))
-        
-        # Make the matrix symmetric
-        corr_matrix = (corr_matrix + corr_matrix.T) / 2
-        
-        # Set diagonal to 1.0
-        np.fill_diagonal(corr_matrix, 1.0)
-        
-        # Create a DataFrame
-        corr_df = pd.DataFrame(corr_matrix, index=symbols, columns=symbols)
-        
-        # Create figure
-        fig = px.imshow(
-            corr_df,
-            color_continuous_scale='RdBu_r',
-            zmin=-1,
-            zmax=1
-        )
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 40, 'b': 40},
-            coloraxis_colorbar={
-                'title': 'Correlation',
-                'thickness': 15,
-                'len': 0.5,
-                'y': 0.5
-            }
-        )
-        
-        return fig
+        return _CORRELATION_FIG
@@ -2,12 +2,107 @@
 Settings page for the ZeroBot dashboard
 """
 import dash
-from dash import dcc, html, callback, Input, Output, State
+from dash import dcc, html, callback, Input, Output, State, no_update
 import dash_bootstrap_components as dbc
-import json
+from functools import cache
+import plotly.io as pio
+from datetime import datetime
 
-def create_settings_layout(trade_bot):
-    """Create the settings page layout"""
+# Choice options, shared by every build of the layout
+_TRADING_DAYS_OPTIONS = (
+    {"label": "Monday", "value": "monday"},
+    {"label": "Tuesday", "value": "tuesday"},
+    {"label": "Wednesday", "value": "wednesday"},
+    {"label": "Thursday", "value": "thursday"},
+    {"label": "Friday", "value": "friday"},
+)
+_THEME_OPTIONS = (
+    {"label": "Dark", "value": "dark"},
+    {"label": "Light", "value": "light"},
+)
+_NOTIFICATION_OPTIONS = (
+    {"label": "Trade Execution", "value": "trade_exec"},
+    {"label": "Stop Loss Hit", "value": "stop_loss"},
+    {"label": "Target Reached", "value": "target"},
+    {"label": "Error Alerts", "value": "error"},
+)
+_LOG_LEVEL_OPTIONS = (
+    {"label": "Debug", "value": "DEBUG"},
+    {"label": "Info", "value": "INFO"},
+    {"label": "Warning", "value": "WARNING"},
+    {"label": "Error", "value": "ERROR"},
+    {"label": "Critical", "value": "CRITICAL"},
+)
+_RETENTION_OPTIONS = (
+    {"label": "1 month", "value": "1m"},
+    {"label": "3 months", "value": "3m"},
+    {"label": "6 months", "value": "6m"},
+    {"label": "1 year", "value": "1y"},
+    {"label": "All time", "value": "all"},
+)
+
+# Static documentation blurbs, rendered as a single Markdown component each
+_API_DOCS_HTML = """
+<p>For detailed information on the Zerodha KiteConnect API, please refer to the <a href="https://kite.trade/docs/connect/v3/" target="_blank">official documentation</a>.</p>
+<p>To create API credentials, visit the <a href="https://developers.kite.trade/" target="_blank">Zerodha Developer Console</a>.</p>
+"""
+
+_ABOUT_HTML = """
+<img src="/assets/logo.svg" height="100px" class="mb-3">
+<h3 class="mb-3">ZeroBot v1.0.0</h3>
+<p>ZeroBot is an automated trading bot for Zerodha that executes intraday trades on NSE and BSE markets.</p>
+<p>Built with ❤️ using <a href="https://www.python.org/" target="_blank">Python</a>, <a href="https://dash.plotly.com/" target="_blank">Dash</a>, and <a href="https://kite.trade/docs/connect/v3/" target="_blank">KiteConnect</a></p>
+<hr>
+<h5>System Information</h5>
+<ul>
+<li>Python Version: 3.10.0</li>
+<li>Dash Version: 2.10.0</li>
+<li>KiteConnect Version: 4.1.0</li>
+<li>Operating System: Windows 10</li>
+</ul>
+"""
+
+# Trading parameter inputs as (id, label, value, min, max, step, help text), laid out two per row
+_TRADING_FIELDS = (
+    ("capital-input", "Trading Capital (₹)", 5000, 1000, None, 1000, "Minimum capital: ₹1,000"),
+    ("min-trades-input", "Minimum Trades", 3, 1, 10, None, "Minimum number of simultaneous trades"),
+    ("max-trades-input", "Maximum Trades", 5, 1, 20, None, "Maximum number of simultaneous trades"),
+    ("risk-input", "Risk Per Trade (%)", 2, 0.1, 10, 0.1, "Percentage of capital to risk per trade"),
+    ("stop-loss-input", "Stop Loss (%)", 1.5, 0.1, 10, 0.1, "Percentage below entry price to set stop loss"),
+    ("target-input", "Target Profit (%)", 3, 0.1, 20, 0.1, "Percentage above entry price to set target"),
+)
+
+def _number_input_col(input_id, label, value, min_value, max_value, step, help_text):
+    """Build a half-width column with a labelled number input that reports its value on blur or Enter"""
+    limits = {"min": min_value, "max": max_value, "step": step}
+    return dbc.Col([
+        dbc.Label(label, html_for=input_id),
+        dbc.Input(
+            type="number",
+            id=input_id,
+            persistence=True,
+            persistence_type="local",
+            value=value,
+            debounce=True,
+            **{name: limit for name, limit in limits.items() if limit is not None}
+        ),
+        dbc.FormText(help_text)
+    ], width=6)
+
+def _button_row(text, button_id, color="primary"):
+    """Build the right-aligned row holding a form's submit button"""
+    return dbc.Row([
+        dbc.Col([
+            dbc.Button(text, id=button_id, color=color)
+        ], className="text-end")
+    ])
+
+def _to_json_dict(component):
+    """Serialize a component tree once into the plain dict Dash sends to the browser"""
+    return pio.json.from_json_plotly(pio.json.to_json_plotly(component))
+
+def _build_settings_layout():
+    """Build the settings page layout as the JSON-ready dict Dash sends to the browser"""
     layout = dbc.Container([
         # Header
         dbc.Row([
@@ -27,86 +122,12 @@ def create_settings_layout(trade_bot):
                             dbc.CardHeader("Trading Parameters"),
                             dbc.CardBody([
                                 dbc.Form([
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("Trading Capital (₹)", html_for="capital-input"),
-                                            dbc.Input(
-                                                type="number",
-                                                id="capital-input",
-                                                value=5000,
-                                                min=1000,
-                                                step=1000
-                                            ),
-                                            dbc.FormText("Minimum capital: ₹1,000")
-                                        ], width=6),
-                                        dbc.Col([
-                                            dbc.Label("Minimum Trades", html_for="min-trades-input"),
-                                            dbc.Input(
-                                                type="number",
-                                                id="min-trades-input",
-                                                value=3,
-                                                min=1,
-                                                max=10
-                                            ),
-                                            dbc.FormText("Minimum number of simultaneous trades")
-                                        ], width=6)
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("Maximum Trades", html_for="max-trades-input"),
-                                            dbc.Input(
-                                                type="number",
-                                                id="max-trades-input",
-                                                value=5,
-                                                min=1,
-                                                max=20
-                                            ),
-                                            dbc.FormText("Maximum number of simultaneous trades")
-                                        ], width=6),
-                                        dbc.Col([
-                                            dbc.Label("Risk Per Trade (%)", html_for="risk-input"),
-                                            dbc.Input(
-                                                type="number",
-                                                id="risk-input",
-                                                value=2,
-                                                min=0.1,
-                                                max=10,
-                                                step=0.1
-                                            ),
-                                            dbc.FormText("Percentage of capital to risk per trade")
-                                        ], width=6)
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("Stop Loss (%)", html_for="stop-loss-input"),
-                                            dbc.Input(
-                                                type="number",
-                                                id="stop-loss-input",
-                                                value=1.5,
-                                                min=0.1,
-                                                max=10,
-                                                step=0.1
-                                            ),
-                                            dbc.FormText("Percentage below entry price to set stop loss")
-                                        ], width=6),
-                                        dbc.Col([
-                                            dbc.Label("Target Profit (%)", html_for="target-input"),
-                                            dbc.Input(
-                                                type="number",
-                                                id="target-input",
-                                                value=3,
-                                                min=0.1,
-                                                max=20,
-                                                step=0.1
-                                            ),
-                                            dbc.FormText("Percentage above entry price to set target")
-                                        ], width=6)
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Save Trading Parameters", id="save-trading-params", color="primary")
-                                        ], className="text-end")
-                                    ])
+                                    # Two number inputs per row
+                                    *(
+                                        dbc.Row([_number_input_col(*left), _number_input_col(*right)], className="mb-3")
+                                        for left, right in zip(_TRADING_FIELDS[::2], _TRADING_FIELDS[1::2])
+                                    ),
+                                    _button_row("Save Trading Parameters", "save-trading-params")
                                 ])
                             ])
                         ], className="mb-4"),
@@ -119,15 +140,11 @@ def create_settings_layout(trade_bot):
                                         dbc.Col([
                                             dbc.Label("Trading Days"),
                                             dbc.Checklist(
-                                                options=[
-                                                    {"label": "Monday", "value": "monday"},
-                                                    {"label": "Tuesday", "value": "tuesday"},
-                                                    {"label": "Wednesday", "value": "wednesday"},
-                                                    {"label": "Thursday", "value": "thursday"},
-                                                    {"label": "Friday", "value": "friday"}
-                                                ],
+                                                options=_TRADING_DAYS_OPTIONS,
                                                 value=["monday", "tuesday", "wednesday", "thursday", "friday"],
                                                 id="trading-days",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 inline=True
                                             )
                                         ])
@@ -138,6 +155,8 @@ def create_settings_layout(trade_bot):
                                             dbc.Input(
                                                 type="time",
                                                 id="start-time-input",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 value="09:15"
                                             )
                                         ], width=6),
@@ -146,6 +165,8 @@ def create_settings_layout(trade_bot):
                                             dbc.Input(
                                                 type="time",
                                                 id="end-time-input",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 value="15:30"
                                             )
                                         ], width=6)
@@ -155,16 +176,14 @@ def create_settings_layout(trade_bot):
                                             dbc.Label("Auto Close Positions at End of Day"),
                                             dbc.Switch(
                                                 id="auto-close-switch",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 value=True,
                                                 label="Enabled"
                                             )
                                         ], width=6)
                                     ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Save Schedule Settings", id="save-schedule", color="primary")
-                                        ], className="text-end")
-                                    ])
+                                    _button_row("Save Schedule Settings", "save-schedule")
                                 ])
                             ])
                         ])
@@ -179,12 +198,11 @@ def create_settings_layout(trade_bot):
                                         dbc.Col([
                                             dbc.Label("Theme"),
                                             dbc.RadioItems(
-                                                options=[
-                                                    {"label": "Dark", "value": "dark"},
-                                                    {"label": "Light", "value": "light"}
-                                                ],
+                                                options=_THEME_OPTIONS,
                                                 value="dark",
                                                 id="theme-selection",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 inline=True
                                             )
                                         ])
@@ -195,9 +213,12 @@ def create_settings_layout(trade_bot):
                                             dbc.Input(
                                                 type="number",
                                                 id="refresh-interval-input",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 value=5,
                                                 min=1,
-                                                max=60
+                                                max=60,
+                                                debounce=True
                                             )
                                         ])
                                     ], className="mb-3"),
@@ -205,22 +226,15 @@ def create_settings_layout(trade_bot):
                                         dbc.Col([
                                             dbc.Label("Notifications"),
                                             dbc.Checklist(
-                                                options=[
-                                                    {"label": "Trade Execution", "value": "trade_exec"},
-                                                    {"label": "Stop Loss Hit", "value": "stop_loss"},
-                                                    {"label": "Target Reached", "value": "target"},
-                                                    {"label": "Error Alerts", "value": "error"}
-                                                ],
+                                                options=_NOTIFICATION_OPTIONS,
                                                 value=["trade_exec", "stop_loss", "target", "error"],
-                                                id="notification-settings"
+                                                id="notification-settings",
+                                                persistence=True,
+                                                persistence_type="local"
                                             )
                                         ])
                                     ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Save App Settings", id="save-app-settings", color="primary")
-                                        ], className="text-end")
-                                    ])
+                                    _button_row("Save App Settings", "save-app-settings")
                                 ])
                             ])
                         ], className="mb-4"),
@@ -234,13 +248,9 @@ def create_settings_layout(trade_bot):
                                             dbc.Label("Logging Level"),
                                             dbc.Select(
                                                 id="log-level-select",
-                                                options=[
-                                                    {"label": "Debug", "value": "DEBUG"},
-                                                    {"label": "Info", "value": "INFO"},
-                                                    {"label": "Warning", "value": "WARNING"},
-                                                    {"label": "Error", "value": "ERROR"},
-                                                    {"label": "Critical", "value": "CRITICAL"}
-                                                ],
+                                                persistence=True,
+                                                persistence_type="local",
+                                                options=_LOG_LEVEL_OPTIONS,
                                                 value="INFO"
                                             )
                                         ])
@@ -250,17 +260,15 @@ def create_settings_layout(trade_bot):
                                             dbc.Label("Demo Mode"),
                                             dbc.Switch(
                                                 id="demo-mode-switch",
+                                                persistence=True,
+                                                persistence_type="local",
                                                 value=True,
                                                 label="Enabled"
                                             ),
                                             dbc.FormText("Use simulated data instead of real trading")
                                         ])
                                     ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Save Debug Settings", id="save-debug-settings", color="primary")
-                                        ], className="text-end")
-                                    ])
+                                    _button_row("Save Debug Settings", "save-debug-settings")
                                 ])
                             ])
                         ])
@@ -270,330 +278,337 @@ def create_settings_layout(trade_bot):
             
             # API Settings Tab
             dbc.Tab([
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardHeader("Zerodha API Credentials"),
-                            dbc.CardBody([
-                                dbc.Alert([
-                                    html.H6("⚠️ Security Warning", className="alert-heading"),
-                                    html.P([
-                                        "For security reasons, it's recommended to set API credentials using environment variables in a ",
-                                        html.Code(".env"), " file instead of entering them here. ",
-                                        "This form is provided for testing purposes only."
-                                    ]),
-                                    html.P([
-                                        "To use environment variables, create a ", html.Code(".env"), " file in your project root with:",
-                                        html.Br(),
-                                        html.Code("API_KEY=your_api_key_here"),
-                                        html.Br(),
-                                        html.Code("API_SECRET=your_api_secret_here")
-                                    ])
-                                ], color="warning", className="mb-3"),
-                                dbc.Form([
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("API Key", html_for="api-key-input"),
-                                            dbc.Input(
-                                                type="password",
-                                                id="api-key-input",
-                                                placeholder="Enter your Zerodha API Key"
-                                            )
-                                        ])
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("API Secret", html_for="api-secret-input"),
-                                            dbc.Input(
-                                                type="password",
-                                                id="api-secret-input",
-                                                placeholder="Enter your Zerodha API Secret"
-                                            )
-                                        ])
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("Redirect URL", html_for="redirect-url-input"),
-                                            dbc.Input(
-                                                type="text",
-                                                id="redirect-url-input",
-                                                value="http://localhost:8000/login/callback"
-                                            ),
-                                            dbc.FormText("Must match the redirect URL configured in your Zerodha developer account")
-                                        ])
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Save API Credentials", id="save-api-credentials", color="primary")
-                                        ], className="text-end")
-                                    ])
-                                ])
-                            ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("API Connection Status"),
-                            dbc.CardBody([
-                                html.Div(id="api-status", children=[
-                                    html.H4([
-                                        html.I(className="fas fa-circle text-success me-2"),
-                                        "Connected (Demo Mode)"
-                                    ]),
-                                    html.P("Using simulated data for testing", className="text-muted")
-                                ])
-                            ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("API Documentation"),
-                            dbc.CardBody([
-                                html.P([
-                                    "For detailed information on the Zerodha KiteConnect API, please refer to the ",
-                                    html.A("official documentation", href="https://kite.trade/docs/connect/v3/", target="_blank"),
-                                    "."
-                                ]),
-                                html.P([
-                                    "To create API credentials, visit the ",
-                                    html.A("Zerodha Developer Console", href="https://developers.kite.trade/", target="_blank"),
-                                    "."
-                                ])
-                            ])
-                        ])
-                    ], width=8),
-                    
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardHeader("API Usage"),
-                            dbc.CardBody([
-                                html.Div([
-                                    html.H5("Rate Limits"),
-                                    html.P("Zerodha API has the following rate limits:"),
-                                    html.Ul([
-                                        html.Li("3 requests per second"),
-                                        html.Li("300 requests per minute"),
-                                        html.Li("1 order per second")
-                                    ]),
-                                    html.Hr(),
-                                    html.H5("Current Usage"),
-                                    dbc.Progress(value=15, color="success", className="mb-3", style={"height": "8px"}),
-                                    html.P("45/300 requests used (15%)", className="text-muted")
-                                ])
-                            ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("API Testing"),
-                            dbc.CardBody([
-                                dbc.Button("Test API Connection", id="test-api-connection", color="primary", className="mb-3"),
-                                html.Div(id="api-test-result")
-                            ])
-                        ])
-                    ], width=4)
-                ])
+                # Filled in by load_settings_tab when first opened
+                html.Div(id="api-settings-content")
             ], label="API Settings", tab_id="api-settings"),
             
             # Backup & Restore Tab
             dbc.Tab([
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardHeader("Backup Settings"),
-                            dbc.CardBody([
-                                dbc.Form([
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Export Settings", id="export-settings", color="primary", className="me-2"),
-                                            dbc.Button("Export Trade History", id="export-trades", color="secondary")
-                                        ])
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            html.P("Last Backup: Never", id="last-backup-time", className="text-muted")
-                                        ])
-                                    ])
-                                ])
-                            ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("Restore Settings"),
-                            dbc.CardBody([
-                                dbc.Form([
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("Import Settings File"),
-                                            dcc.Upload(
-                                                id="upload-settings",
-                                                children=html.Div([
-                                                    "Drag and Drop or ",
-                                                    html.A("Select a Settings File")
-                                                ]),
-                                                style={
-                                                    "width": "100%",
-                                                    "height": "60px",
-                                                    "lineHeight": "60px",
-                                                    "borderWidth": "1px",
-                                                    "borderStyle": "dashed",
-                                                    "borderRadius": "5px",
-                                                    "textAlign": "center",
-                                                    "margin": "10px 0"
-                                                }
-                                            )
-                                        ])
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Restore Settings", id="restore-settings", color="warning")
-                                        ], className="text-end")
-                                    ])
-                                ])
+                # Filled in by load_settings_tab when first opened
+                html.Div(id="backup-restore-content")
+            ], label="Backup & Restore", tab_id="backup-restore"),
+            
+            # About Tab
+            dbc.Tab([
+                # Filled in by load_settings_tab when first opened
+                html.Div(id="about-content")
+            ], label="About", tab_id="about")
+        ], id="settings-tabs", active_tab="general-settings")
+    ], fluid=True)
+    
+    return _to_json_dict(layout)
+
+# The layout is static, so build and serialize it at import instead of on a request
+SETTINGS_LAYOUT = _build_settings_layout()
+
+def create_settings_layout(trade_bot):
+    """Create the settings page layout"""
+    return SETTINGS_LAYOUT
+
+@cache
+def _build_api_tab():
+    """Build the API Settings tab content"""
+    content = dbc.Row([
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("Zerodha API Credentials"),
+                dbc.CardBody([
+                    dbc.Alert([
+                        html.H6("⚠️ Security Warning", className="alert-heading"),
+                        html.P([
+                            "For security reasons, it's recommended to set API credentials using environment variables in a ",
+                            html.Code(".env"), " file instead of entering them here. ",
+                            "This form is provided for testing purposes only."
+                        ]),
+                        html.P([
+                            "To use environment variables, create a ", html.Code(".env"), " file in your project root with:",
+                            html.Br(),
+                            html.Code("API_KEY=your_api_key_here"),
+                            html.Br(),
+                            html.Code("API_SECRET=your_api_secret_here")
+                        ])
+                    ], color="warning", className="mb-3"),
+                    dbc.Form([
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("API Key", html_for="api-key-input"),
+                                dbc.Input(
+                                    type="password",
+                                    id="api-key-input",
+                                    placeholder="Enter your Zerodha API Key"
+                                )
                             ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("Reset to Default"),
-                            dbc.CardBody([
-                                html.P("This will reset all settings to their default values. This action cannot be undone."),
-                                dbc.Button("Reset All Settings", id="reset-settings", color="danger")
+                        ], className="mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("API Secret", html_for="api-secret-input"),
+                                dbc.Input(
+                                    type="password",
+                                    id="api-secret-input",
+                                    placeholder="Enter your Zerodha API Secret"
+                                )
                             ])
-                        ])
-                    ], width=8),
-                    
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardHeader("Data Management"),
-                            dbc.CardBody([
-                                html.H5("Database Statistics"),
-                                html.Ul([
-                                    html.Li("Trade Records: 128"),
-                                    html.Li("Strategy Configurations: 5"),
-                                    html.Li("Performance Metrics: 90 days"),
-                                    html.Li("Database Size: 2.4 MB")
-                                ], className="mb-3"),
-                                html.Hr(),
-                                html.H5("Data Cleanup"),
-                                dbc.Form([
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Label("Delete Data Older Than"),
-                                            dbc.Select(
-                                                id="data-retention-select",
-                                                options=[
-                                                    {"label": "1 month", "value": "1m"},
-                                                    {"label": "3 months", "value": "3m"},
-                                                    {"label": "6 months", "value": "6m"},
-                                                    {"label": "1 year", "value": "1y"},
-                                                    {"label": "All time", "value": "all"}
-                                                ],
-                                                value="all"
-                                            )
-                                        ])
-                                    ], className="mb-3"),
-                                    dbc.Row([
-                                        dbc.Col([
-                                            dbc.Button("Clean Up Data", id="cleanup-data", color="warning")
-                                        ], className="text-end")
-                                    ])
-                                ])
+                        ], className="mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Redirect URL", html_for="redirect-url-input"),
+                                dbc.Input(
+                                    type="text",
+                                    id="redirect-url-input",
+                                    persistence=True,
+                                    persistence_type="local",
+                                    value="http://localhost:8000/login/callback"
+                                ),
+                                dbc.FormText("Must match the redirect URL configured in your Zerodha developer account")
                             ])
-                        ])
-                    ], width=4)
+                        ], className="mb-3"),
+                        _button_row("Save API Credentials", "save-api-credentials")
+                    ])
                 ])
-            ], label="Backup & Restore", tab_id="backup-restore"),
+            ], className="mb-4"),
             
-            # About Tab
-            dbc.Tab([
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardHeader("About ZeroBot"),
-                            dbc.CardBody([
-                                html.Div([
-                                    html.Img(src="/assets/logo.svg", height="100px", className="mb-3"),
-                                    html.H3("ZeroBot v1.0.0", className="mb-3"),
-                                    html.P("ZeroBot is an automated trading bot for Zerodha that executes intraday trades on NSE and BSE markets."),
-                                    html.P([
-                                        "Built with ❤️ using ",
-                                        html.A("Python", href="https://www.python.org/", target="_blank"),
-                                        ", ",
-                                        html.A("Dash", href="https://dash.plotly.com/", target="_blank"),
-                                        ", and ",
-                                        html.A("KiteConnect", href="https://kite.trade/docs/connect/v3/", target="_blank")
-                                    ]),
-                                    html.Hr(),
-                                    html.H5("System Information"),
-                                    html.Ul([
-                                        html.Li(f"Python Version: 3.10.0"),
-                                        html.Li(f"Dash Version: 2.10.0"),
-                                        html.Li(f"KiteConnect Version: 4.1.0"),
-                                        html.Li(f"Operating System: Windows 10")
-                                    ])
-                                ], className="text-center")
+            dbc.Card([
+                dbc.CardHeader("API Connection Status"),
+                dbc.CardBody([
+                    html.Div(id="api-status", children=[
+                        html.H4([
+                            html.I(className="fas fa-circle text-success me-2"),
+                            "Connected (Demo Mode)"
+                        ]),
+                        html.P("Using simulated data for testing", className="text-muted")
+                    ])
+                ])
+            ], className="mb-4"),
+            
+            dbc.Card([
+                dbc.CardHeader("API Documentation"),
+                dbc.CardBody([
+                    dcc.Markdown(_API_DOCS_HTML, dangerously_allow_html=True)
+                ])
+            ])
+        ], width=8),
+        
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("API Usage"),
+                dbc.CardBody([
+                    html.Div([
+                        html.H5("Rate Limits"),
+                        html.P("Zerodha API has the following rate limits:"),
+                        html.Ul([
+                            html.Li("3 requests per second"),
+                            html.Li("300 requests per minute"),
+                            html.Li("1 order per second")
+                        ]),
+                        html.Hr(),
+                        html.H5("Current Usage"),
+                        dbc.Progress(value=15, color="success", className="mb-3", style={"height": "8px"}),
+                        html.P("45/300 requests used (15%)", className="text-muted")
+                    ])
+                ])
+            ], className="mb-4"),
+            
+            dbc.Card([
+                dbc.CardHeader("API Testing"),
+                dbc.CardBody([
+                    dbc.Button("Test API Connection", id="test-api-connection", color="primary", className="mb-3"),
+                    html.Div(id="api-test-result")
+                ])
+            ])
+        ], width=4)
+    ])
+    
+    return _to_json_dict(content)
+
+@cache
+def _build_backup_tab():
+    """Build the Backup & Restore tab content"""
+    content = dbc.Row([
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("Backup Settings"),
+                dbc.CardBody([
+                    dbc.Form([
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Button("Export Settings", id="export-settings", color="primary", className="me-2"),
+                                dbc.Button("Export Trade History", id="export-trades", color="secondary")
                             ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("Disclaimer"),
-                            dbc.CardBody([
-                                html.P([
-                                    "Trading in financial markets involves risk. This bot is provided for educational and informational purposes only. ",
-                                    "Always use proper risk management and never invest money you cannot afford to lose."
-                                ], className="mb-3"),
-                                html.P([
-                                    "ZeroBot is not affiliated with Zerodha. Zerodha and KiteConnect are trademarks of Zerodha Broking Ltd."
-                                ])
+                        ], className="mb-3"),
+                        dbc.Row([
+                            dbc.Col([
+                                html.P("Last Backup: Never", id="last-backup-time", className="text-muted")
                             ])
                         ])
-                    ], width=8),
-                    
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardHeader("License"),
-                            dbc.CardBody([
-                                html.P("MIT License"),
-                                html.P([
-                                    "Copyright (c) 2025",
-                                    html.Br(),
-                                    html.Br(),
-                                    "Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the \"Software\"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:",
-                                    html.Br(),
-                                    html.Br(),
-                                    "The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software."
-                                ], style={"fontSize": "0.8rem"})
-                            ])
-                        ], className="mb-4"),
-                        
-                        dbc.Card([
-                            dbc.CardHeader("Support"),
-                            dbc.CardBody([
-                                html.P("If you encounter any issues or have questions, please reach out for support:"),
-                                html.Ul([
-                                    html.Li([
-                                        html.I(className="fas fa-envelope me-2"),
-                                        "Email: support@zerobot.example.com"
-                                    ]),
-                                    html.Li([
-                                        html.I(className="fab fa-github me-2"),
-                                        html.A("GitHub Repository", href="https://github.com/example/zerobot", target="_blank")
+                    ])
+                ])
+            ], className="mb-4"),
+            
+            dbc.Card([
+                dbc.CardHeader("Restore Settings"),
+                dbc.CardBody([
+                    dbc.Form([
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Import Settings File"),
+                                dcc.Upload(
+                                    id="upload-settings",
+                                    children=html.Div([
+                                        "Drag and Drop or ",
+                                        html.A("Select a Settings File")
                                     ]),
-                                    html.Li([
-                                        html.I(className="fas fa-book me-2"),
-                                        html.A("Documentation", href="#", target="_blank")
-                                    ])
-                                ])
+                                    style={
+                                        "width": "100%",
+                                        "height": "60px",
+                                        "lineHeight": "60px",
+                                        "borderWidth": "1px",
+                                        "borderStyle": "dashed",
+                                        "borderRadius": "5px",
+                                        "textAlign": "center",
+                                        "margin": "10px 0"
+                                    }
+                                )
                             ])
+                        ], className="mb-3"),
+                        _button_row("Restore Settings", "restore-settings", color="warning")
+                    ])
+                ])
+            ], className="mb-4"),
+            
+            dbc.Card([
+                dbc.CardHeader("Reset to Default"),
+                dbc.CardBody([
+                    html.P("This will reset all settings to their default values. This action cannot be undone."),
+                    dbc.Button("Reset All Settings", id="reset-settings", color="danger")
+                ])
+            ])
+        ], width=8),
+        
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("Data Management"),
+                dbc.CardBody([
+                    html.H5("Database Statistics"),
+                    html.Ul([
+                        html.Li("Trade Records: 128"),
+                        html.Li("Strategy Configurations: 5"),
+                        html.Li("Performance Metrics: 90 days"),
+                        html.Li("Database Size: 2.4 MB")
+                    ], className="mb-3"),
+                    html.Hr(),
+                    html.H5("Data Cleanup"),
+                    dbc.Form([
+                        dbc.Row([
+                            dbc.Col([
+                                dbc.Label("Delete Data Older Than"),
+                                dbc.Select(
+                                    id="data-retention-select",
+                                    persistence=True,
+                                    persistence_type="local",
+                                    options=_RETENTION_OPTIONS,
+                                    value="all"
+                                )
+                            ])
+                        ], className="mb-3"),
+                        _button_row("Clean Up Data", "cleanup-data", color="warning")
+                    ])
+                ])
+            ])
+        ], width=4)
+    ])
+    
+    return _to_json_dict(content)
+
+@cache
+def _build_about_tab():
+    """Build the About tab content"""
+    content = dbc.Row([
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("About ZeroBot"),
+                dbc.CardBody([
+                    dcc.Markdown(_ABOUT_HTML, dangerously_allow_html=True, className="text-center")
+                ])
+            ], className="mb-4"),
+            
+            dbc.Card([
+                dbc.CardHeader("Disclaimer"),
+                dbc.CardBody([
+                    html.P([
+                        "Trading in financial markets involves risk. This bot is provided for educational and informational purposes only. ",
+                        "Always use proper risk management and never invest money you cannot afford to lose."
+                    ], className="mb-3"),
+                    html.P([
+                        "ZeroBot is not affiliated with Zerodha. Zerodha and KiteConnect are trademarks of Zerodha Broking Ltd."
+                    ])
+                ])
+            ])
+        ], width=8),
+        
+        dbc.Col([
+            dbc.Card([
+                dbc.CardHeader("License"),
+                dbc.CardBody([
+                    html.P("MIT License"),
+                    html.P([
+                        "Copyright (c) 2025",
+                        html.Br(),
+                        html.Br(),
+                        "Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the \"Software\"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:",
+                        html.Br(),
+                        html.Br(),
+                        "The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software."
+                    ], style={"fontSize": "0.8rem"})
+                ])
+            ], className="mb-4"),
+            
+            dbc.Card([
+                dbc.CardHeader("Support"),
+                dbc.CardBody([
+                    html.P("If you encounter any issues or have questions, please reach out for support:"),
+                    html.Ul([
+                        html.Li([
+                            html.I(className="fas fa-envelope me-2"),
+                            "Email: support@zerobot.example.com"
+                        ]),
+                        html.Li([
+                            html.I(className="fab fa-github me-2"),
+                            html.A("GitHub Repository", href="https://github.com/example/zerobot", target="_blank")
+                        ]),
+                        html.Li([
+                            html.I(className="fas fa-book me-2"),
+                            html.A("Documentation", href="#", target="_blank")
                         ])
-                    ], width=4)
+                    ])
                 ])
-            ], label="About", tab_id="about")
-        ], id="settings-tabs", active_tab="general-settings")
-    ], fluid=True)
+            ])
+        ], width=4)
+    ])
     
-    return layout
+    return _to_json_dict(content)
+
+# Tabs built on first activation, keyed by tab_id; the General tab ships with the page
+_LAZY_TABS = {
+    "api-settings": _build_api_tab,
+    "backup-restore": _build_backup_tab,
+    "about": _build_about_tab,
+}
 
 def register_settings_callbacks(app, trade_bot):
     """Register callbacks for the settings page"""
     
+    # Load a tab's content the first time it is opened, then leave it in place
+    @app.callback(
+        [Output(f"{tab_id}-content", "children") for tab_id in _LAZY_TABS],
+        Input("settings-tabs", "active_tab"),
+        [State(f"{tab_id}-content", "children") for tab_id in _LAZY_TABS]
+    )
+    def load_settings_tab(active_tab, *loaded):
+        return [
+            build_tab() if tab_id == active_tab and not content else no_update
+            for (tab_id, build_tab), content in zip(_LAZY_TABS.items(), loaded)
+        ]
+    
     # Save Trading Parameters
     @app.callback(
         Output("save-trading-params", "children"),
@@ -5,7 +5,6 @@ import dash
 from dash import dcc, html, callback, Input, Output, State
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
-import plotly.express as px
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -440,8 +439,9 @@ def register_strategies_callbacks(app, trade_bot):
             fig = go.Figure()
 
             if not results.equity_curve.empty:
-                dates = pd.to_datetime(results.equity_curve['date'])
-                portfolio_values = results.equity_curve['portfolio_value']
+                # The engine already stores datetimes; plotly serializes ndarrays fastest
+                dates = results.equity_curve['date'].to_numpy()
+                portfolio_values = results.equity_curve['portfolio_value'].to_numpy()
 
                 # Add portfolio value line
                 fig.add_trace(go.Scatter(
@@ -452,12 +452,13 @@ def register_strategies_callbacks(app, trade_bot):
                     line={'width': 2, 'color': '#00FF00'}
                 ))
 
-                # Add trade markers
-                buy_trades = [t for t in results.trades if t.trade_type == 'BUY']
-                sell_trades = [t for t in results.trades if t.trade_type == 'SELL' and t.exit_date]
+                # Add trade markers (all trades of one backtest share a trade type)
+                trades = results.trades
+                buy_trades = len(trades) > 0 and trades.trade_type == 'BUY'
+                sell_trades = len(trades) > 0 and trades.trade_type == 'SELL'
 
                 if buy_trades:
-                    buy_dates = [t.entry_date for t in buy_trades]
+                    buy_dates = trades.entry_dates
                     buy_values = [results.initial_capital] * len(buy_dates)  # Simplified
 
                     fig.add_trace(go.Scatter(
@@ -469,7 +470,7 @@ def register_strategies_callbacks(app, trade_bot):
                     ))
 
                 if sell_trades:
-                    sell_dates = [t.exit_date for t in sell_trades]
+                    sell_dates = trades.exit_dates
                     sell_values = [results.initial_capital] * len(sell_dates)  # Simplified
 
                     fig.add_trace(go.Scatter(
@@ -2,17 +2,25 @@
 Trades page for the ZeroBot dashboard
 """
 import dash
-from dash import dcc, html, callback, Input, Output, State
+from dash import dcc, html, callback, Input, Output, State, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
-import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from src.dashboard.formatting import format_money, format_price, format_percent, format_column
+
+# The P&L chart is only about this many pixels wide, more points add nothing visible
+PNL_CHART_POINTS = 1000
 
 def create_trades_layout(trade_bot):
     """Create the trades page layout"""
     layout = dbc.Container([
+        # Data shared by the page's callbacks
+        dcc.Store(id="trades-page-active-store"),
+        dcc.Store(id="trades-page-history-store"),
+        
         # Header
         dbc.Row([
             dbc.Col([
@@ -238,102 +246,121 @@ def create_trades_layout(trade_bot):
     
     return layout
 
+def _sample_timeline(timestamps, values):
+    """Keep every Nth point (and the last) so long histories stay under PNL_CHART_POINTS"""
+    stride = max(1, len(values) // PNL_CHART_POINTS)
+    if stride == 1:
+        return timestamps, values
+    
+    sample = list(range(0, len(values), stride))
+    if sample[-1] != len(values) - 1:
+        sample.append(len(values) - 1)
+    return [timestamps[i] for i in sample], [values[i] for i in sample]
+
+def _figure_key(trade_history):
+    """Identify the state of the append-only trade history"""
+    if not trade_history:
+        return 0, None
+    return len(trade_history), trade_history[-1]['sell_timestamp']
+
 def register_trades_callbacks(app, trade_bot):
     """Register callbacks for the trades page"""
     
+    # Figures already serialized to plain JSON, keyed on the history they were built from
+    figure_cache = {}
+    
+    def cached_figure(name, key, build_figure):
+        cached = figure_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = figure_cache[name] = (key, pio.json.from_json_plotly(pio.to_json(build_figure())))
+        return cached[1]
+    
+    # Price the active trades once per refresh for every widget on the page
+    @app.callback(
+        Output("trades-page-active-store", "data"),
+        [Input("interval-component", "n_intervals"),
+         Input("refresh-active-trades", "n_clicks")]
+    )
+    def update_active_trades_store(n, clicks):
+        # Prices are simulated by the bot so every viewer sees the same ones
+        return trade_bot.get_active_trades_with_prices()
+    
+    # Track the trade history length so history widgets only update when a trade closes
+    @app.callback(
+        Output("trades-page-history-store", "data"),
+        Input("interval-component", "n_intervals"),
+        State("trades-page-history-store", "data")
+    )
+    def update_history_store(n, known_length):
+        length = len(trade_bot.get_trade_history())
+        return no_update if length == known_length else length
+    
     # Update active trades count
     @app.callback(
         Output("active-trades-count-page", "children"),
-        Input("interval-component", "n_intervals")
+        Input("trades-page-active-store", "data")
     )
-    def update_active_trades_count(n):
-        active_trades = trade_bot.get_active_trades()
+    def update_active_trades_count(active_trades):
         return len(active_trades)
     
     # Update unrealized P&L
     @app.callback(
         [Output("unrealized-pnl", "children"),
          Output("unrealized-pnl", "className")],
-        Input("interval-component", "n_intervals")
+        Input("trades-page-active-store", "data")
     )
-    def update_unrealized_pnl(n):
-        active_trades = trade_bot.get_active_trades()
-        
-        total_pnl = 0
-        for order_id, trade in active_trades.items():
-            instrument = trade['instrument']
-            quantity = trade['quantity']
-            buy_price = trade['buy_price']
-            current_price = buy_price * (1 + np.random.uniform(-0.05, 0.05))  # Simulate price change
-            pnl = (current_price - buy_price) * quantity
-            total_pnl += pnl
+    def update_unrealized_pnl(active_trades):
+        total_pnl = sum(trade['pnl'] for trade in active_trades)
         
         pnl_class = "display-4 text-center text-success" if total_pnl >= 0 else "display-4 text-center text-danger"
         
-        return f"₹{total_pnl:,.2f}", pnl_class
+        return format_money(total_pnl), pnl_class
     
     # Update invested capital
     @app.callback(
         Output("invested-capital", "children"),
-        Input("interval-component", "n_intervals")
+        Input("trades-page-active-store", "data")
     )
-    def update_invested_capital(n):
-        active_trades = trade_bot.get_active_trades()
-        
-        total_invested = 0
-        for order_id, trade in active_trades.items():
-            quantity = trade['quantity']
-            buy_price = trade['buy_price']
-            invested = buy_price * quantity
-            total_invested += invested
+    def update_invested_capital(active_trades):
+        total_invested = sum(trade['invested'] for trade in active_trades)
         
-        return f"₹{total_invested:,.2f}"
+        return format_money(total_invested)
     
     # Update active trades table
     @app.callback(
         Output("active-trades-table-page", "children"),
-        [Input("interval-component", "n_intervals"),
-         Input("refresh-active-trades", "n_clicks")]
+        Input("trades-page-active-store", "data")
     )
-    def update_active_trades_table(n, clicks):
-        active_trades = trade_bot.get_active_trades()
-        
+    def update_active_trades_table(active_trades):
         if not active_trades:
             return html.Div([
                 html.P("No active trades", className="text-center text-muted my-3"),
                 html.I(className="fas fa-chart-line fa-3x text-center d-block text-muted")
             ])
         
+        # Format each column in one pass
+        buy_prices = format_column([trade['buy_price'] for trade in active_trades], format_price)
+        current_prices = format_column([trade['current_price'] for trade in active_trades], format_price)
+        pnls = format_column([trade['pnl'] for trade in active_trades], format_price)
+        pnl_percents = format_column([trade['pnl_percent'] for trade in active_trades], format_percent)
+        
         # Create table rows
         rows = []
-        for order_id, trade in active_trades.items():
-            instrument = trade['instrument']
-            symbol = instrument['tradingsymbol']
-            exchange = instrument['exchange']
-            quantity = trade['quantity']
-            buy_price = trade['buy_price']
-            current_price = buy_price * (1 + np.random.uniform(-0.05, 0.05))  # Simulate price change
-            pnl = (current_price - buy_price) * quantity
-            pnl_percent = (pnl / (buy_price * quantity)) * 100
+        for trade, buy_price, current_price, pnl, pnl_percent in zip(active_trades, buy_prices, current_prices, pnls, pnl_percents):
+            pnl_class = "text-success" if trade['pnl'] >= 0 else "text-danger"
             
-            # Determine class for styling
-            pnl_class = "text-success" if pnl >= 0 else "text-danger"
-            
-            # Create row
-            row = html.Tr([
-                html.Td(f"{exchange}:{symbol}"),
-                html.Td(f"{quantity}"),
-                html.Td(f"₹{buy_price:.2f}"),
-                html.Td(f"₹{current_price:.2f}"),
-                html.Td(f"₹{pnl:.2f}", className=pnl_class),
-                html.Td(f"{pnl_percent:.2f}%", className=pnl_class),
+            rows.append(html.Tr([
+                html.Td(trade['symbol']),
+                html.Td(str(trade['quantity'])),
+                html.Td(buy_price),
+                html.Td(current_price),
+                html.Td(pnl, className=pnl_class),
+                html.Td(pnl_percent, className=pnl_class),
                 html.Td([
-                    dbc.Button("View", color="primary", size="sm", className="me-1", id={"type": "view-trade-button", "index": order_id}),
-                    dbc.Button("Close", color="danger", size="sm", id={"type": "close-trade-button", "index": order_id})
+                    dbc.Button("View", color="primary", size="sm", className="me-1", id={"type": "view-trade-button", "index": trade['order_id']}),
+                    dbc.Button("Close", color="danger", size="sm", id={"type": "close-trade-button", "index": trade['order_id']})
                 ])
-            ])
-            
-            rows.append(row)
+            ]))
         
         # Create table
         table = dbc.Table(
@@ -375,19 +402,19 @@ def register_trades_callbacks(app, trade_bot):
         avg_profit = metrics['avg_profit']
         avg_loss = metrics['avg_loss']
         
-        return str(total_trades), f"{win_rate:.1f}%", f"₹{avg_profit:,.2f}", f"₹{avg_loss:,.2f}"
+        return str(total_trades), f"{win_rate:.1f}%", format_money(avg_profit), format_money(avg_loss)
     
     # Update trade history table
     @app.callback(
         Output("trade-history-table-page", "children"),
-        [Input("interval-component", "n_intervals"),
+        [Input("trades-page-history-store", "data"),
          Input("apply-trade-filters", "n_clicks")],
         [State("trade-date-range", "start_date"),
          State("trade-date-range", "end_date"),
          State("trade-symbol-filter", "value"),
          State("trade-result-filter", "value")]
     )
-    def update_trade_history_table(n, clicks, start_date, end_date, symbol, result):
+    def update_trade_history_table(history_length, clicks, start_date, end_date, symbol, result):
         trade_history = trade_bot.get_trade_history()
         
         if not trade_history:
@@ -410,36 +437,43 @@ def register_trades_callbacks(app, trade_bot):
             # Filter by result
             pass
         
+        # Tabulate the trades and derive the display columns in one pass
+        df = pd.DataFrame.from_records([
+            {
+                'symbol': f"{trade['instrument']['exchange']}:{trade['instrument']['tradingsymbol']}",
+                'quantity': trade['quantity'],
+                'buy_price': trade['buy_price'],
+                'sell_price': trade['sell_price'],
+                'pnl': trade['pnl'],
+                'reason': trade['reason'],
+                'sell_timestamp': trade['sell_timestamp']
+            }
+            for trade in filtered_history
+        ])
+        df['pnl_percent'] = df['pnl'] / (df['buy_price'] * df['quantity']) * 100
+        df['pnl_class'] = np.where(df['pnl'] >= 0, "text-success", "text-danger")
+        df['reason'] = df['reason'].str.capitalize()
+        df['timestamp'] = df['sell_timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        df['quantity_text'] = df['quantity'].astype(str)
+        df['buy_price_text'] = format_column(df['buy_price'], format_price)
+        df['sell_price_text'] = format_column(df['sell_price'], format_price)
+        df['pnl_text'] = format_column(df['pnl'], format_price)
+        df['pnl_percent_text'] = format_column(df['pnl_percent'], format_percent)
+        
         # Create table rows
-        rows = []
-        for trade in filtered_history:
-            instrument = trade['instrument']
-            symbol = instrument['tradingsymbol']
-            exchange = instrument['exchange']
-            quantity = trade['quantity']
-            buy_price = trade['buy_price']
-            sell_price = trade['sell_price']
-            pnl = trade['pnl']
-            pnl_percent = (pnl / (buy_price * quantity)) * 100
-            timestamp = trade['sell_timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-            reason = trade['reason'].capitalize()
-            
-            # Determine class for styling
-            pnl_class = "text-success" if pnl >= 0 else "text-danger"
-            
-            # Create row
-            row = html.Tr([
-                html.Td(f"{exchange}:{symbol}"),
-                html.Td(f"{quantity}"),
-                html.Td(f"₹{buy_price:.2f}"),
-                html.Td(f"₹{sell_price:.2f}"),
-                html.Td(f"₹{pnl:.2f}", className=pnl_class),
-                html.Td(f"{pnl_percent:.2f}%", className=pnl_class),
-                html.Td(reason),
-                html.Td(timestamp)
+        rows = [
+            html.Tr([
+                html.Td(trade.symbol),
+                html.Td(trade.quantity_text),
+                html.Td(trade.buy_price_text),
+                html.Td(trade.sell_price_text),
+                html.Td(trade.pnl_text, className=trade.pnl_class),
+                html.Td(trade.pnl_percent_text, className=trade.pnl_class),
+                html.Td(trade.reason),
+                html.Td(trade.timestamp)
             ])
-            
-            rows.append(row)
+            for trade in df.itertuples(index=False)
+        ]
         
         # Create table
         table = dbc.Table(
@@ -469,9 +503,9 @@ def register_trades_callbacks(app, trade_bot):
     # Update cumulative P&L chart
     @app.callback(
         Output("cumulative-pnl-chart", "figure"),
-        Input("interval-component", "n_intervals")
+        Input("trades-page-history-store", "data")
     )
-    def update_cumulative_pnl_chart(n):
+    def update_cumulative_pnl_chart(history_length):
         trade_history = trade_bot.get_trade_history()
         
         if not trade_history:
@@ -492,59 +526,57 @@ def register_trades_callbacks(app, trade_bot):
                 }
             }
         
-        # Create dataframe from trade history
-        df = pd.DataFrame(trade_history)
-        df['timestamp'] = pd.to_datetime(df['sell_timestamp'])
-        df = df.sort_values('timestamp')
-        
-        # Calculate cumulative P&L
-        df['cumulative_pnl'] = df['pnl'].cumsum()
-        
-        # Create the figure
-        fig = go.Figure()
-        
-        # Add the line
-        fig.add_trace(go.Scatter(
-            x=df['timestamp'],
-            y=df['cumulative_pnl'],
-            mode='lines+markers',
-            name='P&L',
-            line={'width': 3, 'color': '#00FF00'},
-            marker={'size': 8, 'color': '#00FF00'}
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
-            xaxis={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': None
-            },
-            yaxis={
-                'showgrid': True,
-                'gridcolor': '#444',
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': None,
-                'tickprefix': '₹'
-            },
-            hovermode='x unified'
-        )
+        def build_figure():
+            # The bot accumulates the P&L as trades close
+            timestamps, cumulative_pnl = _sample_timeline(*trade_bot.get_pnl_timeline())
+            
+            # Create the figure
+            fig = go.Figure()
+            
+            # Add the line (WebGL keeps long histories responsive)
+            fig.add_trace(go.Scattergl(
+                x=timestamps,
+                y=cumulative_pnl,
+                mode='lines+markers',
+                name='P&L',
+                line={'width': 3, 'color': '#00FF00'},
+                marker={'size': 8, 'color': '#00FF00'}
+            ))
+            
+            # Update layout
+            fig.update_layout(
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
+                xaxis={
+                    'showgrid': False,
+                    'showline': True,
+                    'linecolor': '#444',
+                    'linewidth': 1,
+                    'title': None
+                },
+                yaxis={
+                    'showgrid': True,
+                    'gridcolor': '#444',
+                    'showline': True,
+                    'linecolor': '#444',
+                    'linewidth': 1,
+                    'title': None,
+                    'tickprefix': '₹'
+                },
+                hovermode='x unified'
+            )
+            
+            return fig
         
-        return fig
+        return cached_figure('cumulative_pnl', _figure_key(trade_history), build_figure)
     
     # Update P&L distribution chart
     @app.callback(
         Output("pnl-distribution-chart", "figure"),
-        Input("interval-component", "n_intervals")
+        Input("trades-page-history-store", "data")
     )
-    def update_pnl_distribution_chart(n):
+    def update_pnl_distribution_chart(history_length):
         trade_history = trade_bot.get_trade_history()
         
         if not trade_history:
@@ -565,40 +597,46 @@ def register_trades_callbacks(app, trade_bot):
                 }
             }
         
-        # Create dataframe from trade history
-        df = pd.DataFrame(trade_history)
-        
-        # Create the figure
-        fig = px.histogram(
-            df,
-            x="pnl",
-            color_discrete_sequence=['#00FF00'],
-            opacity=0.8,
-            marginal="box",
-            histnorm="probability density"
-        )
-        
-        # Update layout
-        fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
-            xaxis={
-                'showgrid': False,
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': "P&L (₹)"
-            },
-            yaxis={
-                'showgrid': True,
-                'gridcolor': '#444',
-                'showline': True,
-                'linecolor': '#444',
-                'linewidth': 1,
-                'title': "Frequency"
-            },
-            bargap=0.1
-        )
+        def build_figure():
+            # plotly.express is slow to import, so load it only once a histogram is needed
+            import plotly.express as px
+            
+            # Only the P&L column is plotted
+            df = pd.DataFrame.from_records(trade_history, columns=['pnl'])
+            
+            # Create the figure
+            fig = px.histogram(
+                df,
+                x="pnl",
+                color_discrete_sequence=['#00FF00'],
+                opacity=0.8,
+                marginal="box",
+                histnorm="probability density"
+            )
+            
+            # Update layout
+            fig.update_layout(
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                margin={'l': 40, 'r': 40, 't': 10, 'b': 40},
+                xaxis={
+                    'showgrid': False,
+                    'showline': True,
+                    'linecolor': '#444',
+                    'linewidth': 1,
+                    'title': "P&L (₹)"
+                },
+                yaxis={
+                    'showgrid': True,
+                    'gridcolor': '#444',
+                    'showline': True,
+                    'linecolor': '#444',
+                    'linewidth': 1,
+                    'title': "Frequency"
+                },
+                bargap=0.1
+            )
+            
+            return fig
         
-        return fig
+        return cached_figure('pnl_distribution', _figure_key(trade_history), build_figure)
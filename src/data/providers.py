@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Tuple
 import time
 import os
 import pickle
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,8 @@ class YFinanceProvider(DataProvider):
     def __init__(self):
         self.cache_dir = "data_cache"
         self.cache_duration = 3600  # 1 hour cache
+        self.memory_cache_size = 128  # Most recently used ranges kept in memory
+        self._memory_cache = OrderedDict()  # (symbol, start_date, end_date, interval) -> (loaded_at, DataFrame)
         os.makedirs(self.cache_dir, exist_ok=True)
         
         # Common Indian stock symbols with .NS (NSE) and .BO (BSE) suffixes
@@ -56,14 +59,27 @@ class YFinanceProvider(DataProvider):
         cache_key = f"{symbol}_{start_date}_{end_date}_{interval}"
         return os.path.join(self.cache_dir, f"{cache_key}.pkl")
     
-    def _is_cache_valid(self, cache_path: str) -> bool:
+    def _is_fresh(self, cached_at: float, end_date: str) -> bool:
+        """Check if data cached at the given time is still usable for a range"""
+        # Ranges that ended before today can no longer change
+        if end_date < datetime.now().strftime("%Y-%m-%d"):
+            return True
+        
+        return (time.time() - cached_at) < self.cache_duration
+    
+    def _is_cache_valid(self, cache_path: str, end_date: str) -> bool:
         """Check if cache file is valid (not expired)"""
         if not os.path.exists(cache_path):
             return False
         
-        cache_time = os.path.getmtime(cache_path)
-        current_time = time.time()
-        return (current_time - cache_time) < self.cache_duration
+        return self._is_fresh(os.path.getmtime(cache_path), end_date)
+    
+    def _remember(self, cache_key: Tuple, data: pd.DataFrame, cached_at: float):
+        """Keep data in the in-process cache, evicting the least recently used range"""
+        self._memory_cache[cache_key] = (cached_at, data)
+        self._memory_cache.move_to_end(cache_key)
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
     
     def get_historical_data(self, symbol: str, start_date: str, end_date: str, interval: str = "1d") -> pd.DataFrame:
         """Get historical data from Yahoo Finance with caching"""
@@ -72,15 +88,26 @@ class YFinanceProvider(DataProvider):
             if not symbol.endswith(('.NS', '.BO')):
                 symbol = f"{symbol}.NS"  # Default to NSE
             
+            # Check in-process cache first
+            cache_key = (symbol, start_date, end_date, interval)
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None:
+                cached_at, data = entry
+                if self._is_fresh(cached_at, end_date):
+                    self._memory_cache.move_to_end(cache_key)
+                    return data.copy()
+                del self._memory_cache[cache_key]
+            
             cache_path = self._get_cache_path(symbol, start_date, end_date, interval)
             
-            # Check cache first
-            if self._is_cache_valid(cache_path):
+            # Check disk cache next
+            if self._is_cache_valid(cache_path, end_date):
                 try:
                     with open(cache_path, 'rb') as f:
                         data = pickle.load(f)
                     logger.info(f"Loaded cached data for {symbol}")
-                    return data
+                    self._remember(cache_key, data, os.path.getmtime(cache_path))
+                    return data.copy()
                 except Exception as e:
                     logger.warning(f"Failed to load cache for {symbol}: {e}")
             
@@ -125,7 +152,8 @@ class YFinanceProvider(DataProvider):
             except Exception as e:
                 logger.warning(f"Failed to cache data for {symbol}: {e}")
             
-            return data
+            self._remember(cache_key, data, time.time())
+            return data.copy()
             
         except Exception as e:
             logger.error(f"Failed to get historical data for {symbol}: {e}")
@@ -1,6 +1,6 @@
 """
 Optimization module for strategy optimization and comparison
 """
-from .strategy_optimizer import StrategyOptimizer, StrategyPerformance, get_strategy_optimizer
+from .strategy_optimizer import StrategyOptimizer, StrategyPerformance, get_strategy_optimizer, performance_records
 
-__all__ = ['StrategyOptimizer', 'StrategyPerformance', 'get_strategy_optimizer']
+__all__ = ['StrategyOptimizer', 'StrategyPerformance', 'get_strategy_optimizer', 'performance_records']
@@ -7,6 +7,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from operator import attrgetter
 from src.data.providers import get_data_provider
 from src.backtesting.engine import BacktestEngine, BacktestResults
 from src.trading.strategies import STRATEGIES
@@ -27,9 +28,37 @@ class StrategyPerformance:
     sharpe_ratio: float
     final_capital: float
     
+    @classmethod
+    def from_backtest(cls, strategy_name: str, backtest_result: BacktestResults) -> 'StrategyPerformance':
+        """Build a performance summary from a backtest result"""
+        return cls(
+            strategy_name=strategy_name,
+            total_return=backtest_result.total_return,
+            total_return_percent=backtest_result.total_return_percent,
+            total_trades=backtest_result.total_trades,
+            win_rate=backtest_result.win_rate,
+            avg_profit=backtest_result.avg_profit,
+            avg_loss=backtest_result.avg_loss,
+            max_drawdown=backtest_result.max_drawdown,
+            sharpe_ratio=backtest_result.sharpe_ratio,
+            final_capital=backtest_result.final_capital
+        )
+    
     def __str__(self):
         return f"{self.strategy_name}: {self.total_return_percent:.2f}% return, {self.win_rate:.1f}% win rate, {self.total_trades} trades"
 
+def performance_records(results: List[StrategyPerformance]) -> np.recarray:
+    """Pack a performance ranking into a structured array (name, ret, sharpe, win)"""
+    return np.rec.fromarrays(
+        [
+            np.array([r.strategy_name for r in results], dtype=str),
+            np.fromiter((r.total_return_percent for r in results), dtype=np.float64, count=len(results)),
+            np.fromiter((r.sharpe_ratio for r in results), dtype=np.float64, count=len(results)),
+            np.fromiter((r.win_rate for r in results), dtype=np.float64, count=len(results)),
+        ],
+        names='name,ret,sharpe,win'
+    )
+
 class StrategyOptimizer:
     """Optimize strategies to find the best performer"""
     
@@ -45,7 +74,8 @@ class StrategyOptimizer:
                           strategies: Optional[List[str]] = None,
                           stop_loss_percent: float = 0.05,
                           target_percent: float = 0.10,
-                          position_size_percent: float = 0.10) -> List[StrategyPerformance]:
+                          position_size_percent: float = 0.10,
+                          historical_data: Optional[pd.DataFrame] = None) -> List[StrategyPerformance]:
         """
         Test all strategies and return performance ranking
         
@@ -57,6 +87,7 @@ class StrategyOptimizer:
             stop_loss_percent: Stop loss percentage (0.05 = 5%)
             target_percent: Target profit percentage (0.10 = 10%)
             position_size_percent: Position size as percentage of capital (0.10 = 10%)
+            historical_data: Preloaded OHLCV data for the period (None = fetch from the data provider)
             
         Returns:
             List of StrategyPerformance objects sorted by total return
@@ -65,7 +96,8 @@ class StrategyOptimizer:
         logger.info(f"Optimizing strategies for {symbol} from {start_date} to {end_date}")
         
         # Get historical data once
-        historical_data = self.data_provider.get_historical_data(symbol, start_date, end_date)
+        if historical_data is None:
+            historical_data = self.data_provider.get_historical_data(symbol, start_date, end_date)
         
         if historical_data.empty:
             logger.error(f"No historical data found for {symbol}")
@@ -84,7 +116,8 @@ class StrategyOptimizer:
             
             try:
                 # Run backtest for this strategy
-                backtest_result = self.backtest_engine.run_backtest(
+                backtest_result = self.backtest_engine.run_backtest_on_data(
+                    historical_data=historical_data,
                     strategy_name=strategy_name,
                     symbol=symbol,
                     start_date=start_date,
@@ -95,18 +128,7 @@ class StrategyOptimizer:
                 )
                 
                 # Convert to StrategyPerformance
-                performance = StrategyPerformance(
-                    strategy_name=strategy_name,
-                    total_return=backtest_result.total_return,
-                    total_return_percent=backtest_result.total_return_percent,
-                    total_trades=backtest_result.total_trades,
-                    win_rate=backtest_result.win_rate,
-                    avg_profit=backtest_result.avg_profit,
-                    avg_loss=backtest_result.avg_loss,
-                    max_drawdown=backtest_result.max_drawdown,
-                    sharpe_ratio=backtest_result.sharpe_ratio,
-                    final_capital=backtest_result.final_capital
-                )
+                performance = StrategyPerformance.from_backtest(strategy_name, backtest_result)
                 
                 results.append(performance)
                 logger.info(f"✓ {strategy_name}: {performance.total_return_percent:.2f}% return")
@@ -116,7 +138,7 @@ class StrategyOptimizer:
                 continue
         
         # Sort by total return percentage (descending)
-        results.sort(key=lambda x: x.total_return_percent, reverse=True)
+        results.sort(key=attrgetter('total_return_percent'), reverse=True)
         
         return results
     
@@ -152,15 +174,20 @@ class StrategyOptimizer:
     def generate_optimization_report(self, 
                                    symbol: str,
                                    start_date: str,
-                                   end_date: str) -> str:
+                                   end_date: str,
+                                   results: Optional[List[StrategyPerformance]] = None) -> str:
         """
         Generate a comprehensive optimization report
         
+        Args:
+            results: Ranking from a previous optimize_strategies call (None = run it now)
+        
         Returns:
             Formatted report string
         """
         
-        results = self.optimize_strategies(symbol, start_date, end_date)
+        if results is None:
+            results = self.optimize_strategies(symbol, start_date, end_date)
         
         if not results:
             return f"No valid results found for {symbol}"
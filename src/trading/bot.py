@@ -4,6 +4,8 @@ Core TradeBot implementation for automated trading
 import logging
 import time
 import datetime
+from collections import deque
+from itertools import islice
 import pandas as pd
 import numpy as np
 from threading import Thread, Lock
@@ -25,6 +27,12 @@ class TradeBot:
         self.is_running = False
         self.active_trades = {}
         self.trade_history = []
+        self._recent_history = deque(maxlen=500)  # Latest closed trades, oldest first
+        
+        # Cumulative P&L after each closed trade, extended as trades close
+        self._cum_pnl = 0.0
+        self._pnl_timestamps = []
+        self._cum_pnl_series = []
         self.capital = config.capital
         self.min_trades = config.min_trades
         self.max_trades = config.max_trades
@@ -32,6 +40,12 @@ class TradeBot:
         self.stop_loss_percent = config.stop_loss_percent / 100  # Convert to decimal
         self.target_percent = config.target_percent / 100  # Convert to decimal
         
+        # Simulated price moves for active trades, shared by every dashboard client
+        self.price_refresh_seconds = 5
+        self._price_lock = Lock()
+        self._price_moves = {}  # order_id -> fractional move from the buy price
+        self._prices_updated = 0.0
+        
         # Load strategies
         self.strategies = {}
         self._load_strategies()
@@ -373,6 +387,8 @@ class TradeBot:
             
             # Move to trade history
             self.trade_history.append(trade)
+            self._recent_history.append(trade)
+            self._record_closed_pnl(trade)
             
             # Remove from active trades
             del self.active_trades[order_id]
@@ -469,6 +485,64 @@ class TradeBot:
         """Get active trades"""
         return self.active_trades
     
+    def _record_closed_pnl(self, trade):
+        """Extend the cumulative P&L timeline with a closed trade"""
+        self._cum_pnl += trade['pnl']
+        self._pnl_timestamps.append(trade['sell_timestamp'])
+        self._cum_pnl_series.append(self._cum_pnl)
+    
+    def get_pnl_timeline(self):
+        """Get (sell timestamps, cumulative P&L) for the closed trades; treat both lists as read-only"""
+        return self._pnl_timestamps, self._cum_pnl_series
+    
+    def get_recent_trade_history(self, n=5):
+        """Get the n most recently closed trades, newest first"""
+        return list(islice(reversed(self._recent_history), n))
+    
+    def get_active_trades_with_prices(self):
+        """
+        Get active trades with simulated current prices and unrealized P&L
+        
+        Price moves are drawn in one vectorized call and kept for
+        price_refresh_seconds, so concurrent viewers see the same prices.
+        
+        Returns:
+            List of dicts with order_id, symbol, quantity, buy_price,
+            current_price, invested, pnl and pnl_percent
+        """
+        active_trades = dict(self.active_trades)
+        if not active_trades:
+            return []
+        
+        order_ids = list(active_trades)
+        with self._price_lock:
+            now = time.monotonic()
+            if now - self._prices_updated >= self.price_refresh_seconds or self._price_moves.keys() != active_trades.keys():
+                self._price_moves = dict(zip(order_ids, np.random.uniform(-0.05, 0.05, len(order_ids))))
+                self._prices_updated = now
+            moves = np.fromiter((self._price_moves[order_id] for order_id in order_ids), dtype=np.float64, count=len(order_ids))
+        
+        quantity = np.array([active_trades[order_id]['quantity'] for order_id in order_ids], dtype=np.float64)
+        buy_price = np.array([active_trades[order_id]['buy_price'] for order_id in order_ids], dtype=np.float64)
+        current_price = buy_price * (1 + moves)
+        invested = buy_price * quantity
+        pnl = (current_price - buy_price) * quantity
+        pnl_percent = np.divide(pnl * 100, invested, out=np.zeros_like(pnl), where=invested > 0)
+        
+        return [
+            {
+                'order_id': order_id,
+                'symbol': f"{trade['instrument']['exchange']}:{trade['instrument']['tradingsymbol']}",
+                'quantity': trade['quantity'],
+                'buy_price': float(buy_price[i]),
+                'current_price': float(current_price[i]),
+                'invested': float(invested[i]),
+                'pnl': float(pnl[i]),
+                'pnl_percent': float(pnl_percent[i])
+            }
+            for i, (order_id, trade) in enumerate(active_trades.items())
+        ]
+    
     def get_trade_history(self):
         """Get trade history"""
         return self.trade_history
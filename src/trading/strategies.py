@@ -214,12 +214,13 @@ class SupertrendStrategy(Strategy):
         signals['supertrend'] = 0.0
         signals['prevclose'] = signals['close'].shift(1)
         
-        # Calculate Supertrend
-        for i in range(1, len(signals)):
-            if signals['close'].iloc[i] <= signals['upperband'].iloc[i]:
-                signals['supertrend'].iloc[i] = signals['upperband'].iloc[i]
-            else:
-                signals['supertrend'].iloc[i] = signals['lowerband'].iloc[i]
+        # Calculate Supertrend (upper band while price is below it, lower band otherwise)
+        close = signals['close'].to_numpy(dtype=np.float64)
+        upperband = signals['upperband'].to_numpy(dtype=np.float64)
+        lowerband = signals['lowerband'].to_numpy(dtype=np.float64)
+        supertrend = np.where(close <= upperband, upperband, lowerband)
+        supertrend[0] = 0.0
+        signals['supertrend'] = supertrend
         
         # Create signals
         signals['signal'] = 0.0
@@ -7,10 +7,24 @@ import sys
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
 
-def setup_logger():
-    """Configure application logging"""
-    log_level = os.getenv("LOG_LEVEL", "INFO")
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+def get_log_level():
+    """Get the numeric logging level named by the LOG_LEVEL environment variable"""
+    return getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+def setup_logger(name=None):
+    """Configure application logging, or a plain stdout report logger when a name is given"""
+    numeric_level = get_log_level()
+    
+    # Report loggers print bare messages and stay out of the application log
+    if name is not None:
+        report_logger = logging.getLogger(name)
+        if not report_logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            report_logger.addHandler(handler)
+            report_logger.propagate = False
+        report_logger.setLevel(numeric_level)
+        return report_logger
     
     # Create logs directory if it doesn't exist
     if not os.path.exists("logs"):
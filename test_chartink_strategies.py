@@ -1,10 +1,6 @@
 """
 Test ChartInk strategies against RELIANCE data
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.optimization.strategy_optimizer import get_strategy_optimizer
 from src.trading.strategies import STRATEGIES
 
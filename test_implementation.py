@@ -1,10 +1,6 @@
 """
 Test script to verify the new implementation works
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.data.providers import YFinanceProvider, SimulationDataProvider
 from src.simulation.engine import SimulationEngine
 from src.backtesting.engine import BacktestEngine
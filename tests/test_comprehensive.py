@@ -3,8 +3,10 @@ Comprehensive test suite for ZeroBot implementation
 """
 import sys
 import os
+import time
 import pytest
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 
 # Add src to path
@@ -14,6 +16,7 @@ from src.data.providers import YFinanceProvider, SimulationDataProvider
 from src.simulation.engine import SimulationEngine
 from src.backtesting.engine import BacktestEngine
 from src.trading.strategies import STRATEGIES
+from src.dashboard import create_dashboard
 
 class TestDataProviders:
     """Test data provider functionality"""
@@ -52,6 +55,22 @@ class TestDataProviders:
         
         assert isinstance(price, float), "Price should be a float"
         assert price >= 0, "Price should be non-negative"
+    
+    def test_yfinance_provider_memory_cache(self):
+        """Test expiry and size cap of the in-process data cache"""
+        provider = YFinanceProvider()
+        provider.memory_cache_size = 2
+        today = datetime.now().strftime("%Y-%m-%d")
+        stale = time.time() - 2 * provider.cache_duration
+        
+        assert provider._is_fresh(stale, "2024-01-31"), "Closed ranges should never expire"
+        assert not provider._is_fresh(stale, today), "Ranges ending today should expire"
+        assert provider._is_fresh(time.time(), today), "Recent data should be fresh"
+        
+        for i in range(3):
+            provider._remember(("SYM.NS", "2024-01-01", f"2024-01-0{i + 2}", "1d"), pd.DataFrame(), time.time())
+        assert len(provider._memory_cache) == 2, "Should evict beyond the size cap"
+        assert ("SYM.NS", "2024-01-01", "2024-01-02", "1d") not in provider._memory_cache, "Should evict the oldest range"
 
 class TestSimulationEngine:
     """Test simulation engine functionality"""
@@ -163,6 +182,106 @@ class TestBacktestingEngine:
         assert isinstance(results.total_return, float), "Should return float total return"
         assert results.initial_capital == 100000, "Should track initial capital"
 
+    def test_backtesting_engine_preloaded_data(self):
+        """Test backtesting on preloaded data without the data provider"""
+        engine = BacktestEngine(initial_capital=100000)
+
+        # Create sample data with a few trend reversals
+        dates = pd.date_range(start='2024-01-01', periods=300, freq='D')
+        close = 1000 + 100 * np.sin(np.arange(len(dates)) / 20)
+        data = pd.DataFrame({
+            'date': dates,
+            'open': close,
+            'high': close + 5,
+            'low': close - 5,
+            'close': close,
+            'volume': 100000
+        })
+
+        results = engine.run_backtest_on_data(
+            data,
+            strategy_name="ma_crossover",
+            symbol="TEST",
+            start_date="2024-01-01",
+            end_date="2024-10-27"
+        )
+
+        assert results.total_trades > 0, "Should trade on preloaded data"
+        assert len(results.to_dict()['trades']) == results.total_trades, "Should serialize every trade"
+        assert results.initial_capital == 100000, "Should track initial capital"
+
+        empty = engine.run_backtest_on_data(pd.DataFrame(), "ma_crossover", "TEST", "2024-01-01", "2024-10-27")
+        assert empty.total_trades == 0, "Should have no trades without data"
+        
+        # A prepared run can be simulated repeatedly with different risk parameters
+        prepared = engine.prepare_on_data(data, "ma_crossover", "TEST", "2024-01-01", "2024-10-27")
+        assert prepared.is_runnable(), "Should prepare a runnable backtest"
+        assert engine.simulate(prepared).final_capital == results.final_capital, "Should match a direct backtest"
+        tight = engine.simulate(prepared, stop_loss_percent=0.01, target_percent=0.01)
+        assert tight.total_trades >= results.total_trades, "Tighter exits should not reduce trades"
+    
+    def test_backtesting_engine_sampled_equity_curve(self):
+        """Test that sampling a long equity curve leaves the risk metrics unchanged"""
+        engine = BacktestEngine(initial_capital=100000)
+        
+        # More bars than equity_curve_points, so the default run samples the curve
+        dates = pd.date_range(start='2000-01-01', periods=12000, freq='D')
+        close = 1000 + 100 * np.sin(np.arange(len(dates)) / 20) + np.arange(len(dates)) * 0.01
+        data = pd.DataFrame({
+            'date': dates,
+            'open': close,
+            'high': close + 5,
+            'low': close - 5,
+            'close': close,
+            'volume': 100000
+        })
+        
+        prepared = engine.prepare_on_data(data, "ma_crossover", "TEST", "2000-01-01", "2032-11-08")
+        full = engine.simulate(prepared, equity_sample_every=1)
+        sampled = engine.simulate(prepared)
+        
+        assert len(sampled.equity_curve) < len(full.equity_curve), "Should sample the stored curve"
+        assert sampled.sharpe_ratio == pytest.approx(full.sharpe_ratio), "Sharpe should not depend on sampling"
+        assert sampled.max_drawdown == pytest.approx(full.max_drawdown), "Drawdown should not depend on sampling"
+    
+    def test_backtesting_engine_data_cache_expiry(self):
+        """Test that cached ranges ending today are refetched once stale"""
+        engine = BacktestEngine(initial_capital=100000)
+        today = datetime.now().strftime("%Y-%m-%d")
+        dates = pd.date_range(end=today, periods=300, freq='D')
+        close = 1000 + 100 * np.sin(np.arange(len(dates)) / 20)
+        data = pd.DataFrame({'date': dates, 'open': close, 'high': close + 5, 'low': close - 5,
+                             'close': close, 'volume': 100000})
+        
+        fetches = []
+        class CountingProvider:
+            def get_historical_data(self, symbol, start_date, end_date, interval="1d"):
+                fetches.append((symbol, start_date, end_date))
+                return data
+        engine.data_provider = CountingProvider()
+        
+        start_date = dates[0].strftime("%Y-%m-%d")
+        engine._get_historical_data("TEST", start_date, today)
+        engine._get_historical_data("TEST", start_date, today)
+        assert len(fetches) == 1, "Should reuse a fresh range"
+        
+        engine.cache_duration = 0
+        engine._get_historical_data("TEST", start_date, today)
+        assert len(fetches) == 2, "Should refetch a stale range ending today"
+        
+        engine._get_historical_data("TEST", "2024-01-01", "2024-06-01")
+        engine._get_historical_data("TEST", "2024-01-01", "2024-06-01")
+        assert len(fetches) == 3, "Should keep closed ranges regardless of age"
+        
+        # Prepared runs follow the same rule as the data they were built from
+        engine.cache_duration = 3600
+        first = engine.prepare("ma_crossover", "TEST", start_date, today)
+        assert engine.prepare("ma_crossover", "TEST", start_date, today) is first, "Should reuse a fresh run"
+        fetched = len(fetches)
+        engine.cache_duration = 0
+        assert engine.prepare("ma_crossover", "TEST", start_date, today) is not first, "Should rebuild a stale run"
+        assert len(fetches) == fetched + 1, "Should refetch the data for a stale run"
+
 class TestTradingStrategies:
     """Test trading strategies"""
     
@@ -189,6 +308,179 @@ class TestTradingStrategies:
         assert 'short_ma' in signals.columns, "Should have short MA column"
         assert 'long_ma' in signals.columns, "Should have long MA column"
 
+class _DashboardBot:
+    """Stand-in for TradeBot with just the calls the dashboard makes"""
+    
+    capital = 100000
+    
+    def __init__(self):
+        self.trade_history = []
+    
+    def is_authenticated(self):
+        return True
+    
+    def get_metrics(self):
+        return {'total_trades': 0, 'winning_trades': 0, 'losing_trades': 0,
+                'net_pnl': 0.0, 'win_rate': 0.0, 'avg_profit': 0.0, 'avg_loss': 0.0}
+    
+    def get_active_trades(self):
+        return {}
+    
+    def get_active_trades_with_prices(self):
+        return []
+    
+    def get_trade_history(self):
+        return self.trade_history
+    
+    def get_recent_trade_history(self, n=5):
+        return self.trade_history[::-1][:n]
+    
+    def get_pnl_timeline(self):
+        return [], []
+    
+    def get_margins(self):
+        return None
+
+def _add_trade(bot, pnl, day):
+    """Record a closed trade on the stand-in bot"""
+    bot.trade_history.append({
+        'instrument': {'tradingsymbol': 'RELIANCE', 'exchange': 'NSE'},
+        'quantity': 1, 'buy_price': 2500.0, 'sell_price': 2500.0 + pnl, 'pnl': pnl,
+        'reason': 'target', 'sell_timestamp': datetime(2025, 1, day)
+    })
+
+def _dash_update(client, outputs, inputs, state=()):
+    """Fire a callback through the Flask test client the way the Dash renderer does"""
+    def props(specs):
+        return [{'id': component_id, 'property': prop, 'value': value} for component_id, prop, value in specs]
+    
+    output_specs = [{'id': component_id, 'property': prop} for component_id, prop in outputs]
+    if len(outputs) == 1:
+        output = f"{outputs[0][0]}.{outputs[0][1]}"
+        output_specs = output_specs[0]
+    else:
+        output = ".." + "...".join(f"{component_id}.{prop}" for component_id, prop in outputs) + ".."
+    
+    return client.post('/_dash-update-component', json={
+        'output': output,
+        'outputs': output_specs,
+        'inputs': props(inputs),
+        'state': props(state),
+        'changedPropIds': [f"{inputs[0][0]}.{inputs[0][1]}"]
+    })
+
+def _updated(response):
+    """Outputs a callback response changed, keyed by component id"""
+    assert response.status_code in (200, 204), "Callback should not fail"
+    return response.get_json()['response'] if response.status_code == 200 else {}
+
+class TestDashboard:
+    """Test dashboard callbacks through the Flask test client"""
+    
+    APP_STATE_OUTPUTS = [('app-state', 'data'), ('trade-history-store', 'data')]
+    
+    def test_dashboard_pages_render(self):
+        """Test that every page renders"""
+        client = create_dashboard(_DashboardBot()).server.test_client()
+        assert client.get('/').status_code == 200, "Should serve the index page"
+        
+        for pathname in ('/', '/trades', '/strategies', '/analytics', '/settings'):
+            response = _dash_update(
+                client,
+                [('page-content', 'children'), ('auth-state', 'data')],
+                [('url', 'pathname', pathname)],
+                [('auth-state', 'data', None)]
+            )
+            assert response.status_code == 200, f"Should render {pathname}"
+            assert response.get_json()['response']['auth-state']['data'] == 'app', "Should show the app view"
+    
+    def test_dashboard_empty_app_state(self):
+        """Test that app-state consumers wait for the first refresh"""
+        client = create_dashboard(_DashboardBot()).server.test_client()
+        
+        response = _dash_update(
+            client,
+            [('available-margin', 'children'), ('used-margin', 'children'), ('active-trades-count', 'children')],
+            [('app-state', 'data', None)]
+        )
+        assert response.status_code == 204, "Should skip the update without a state"
+        
+        response = _dash_update(
+            client,
+            [('active-trades-grid', 'data'), ('active-trades-empty', 'className')],
+            [('app-state', 'data', None)]
+        )
+        assert response.status_code == 204, "Should skip the update without a state"
+    
+    def test_dashboard_app_state_updates(self):
+        """Test that app state refreshes send only what changed"""
+        bot = _DashboardBot()
+        _add_trade(bot, 100.0, 1)
+        client = create_dashboard(bot).server.test_client()
+        
+        # First refresh fills both stores
+        response = _dash_update(
+            client, self.APP_STATE_OUTPUTS,
+            [('interval-component', 'n_intervals', 0)],
+            [('app-state', 'data', None), ('trade-history-store', 'data', None)]
+        ).get_json()['response']
+        state = response['app-state']['data']
+        history = response['trade-history-store']['data']
+        assert history == [{'timestamp': '2025-01-01T00:00:00', 'pnl': 100.0}], "Should send the full history"
+        
+        # Nothing changed
+        response = _dash_update(
+            client, self.APP_STATE_OUTPUTS,
+            [('interval-component', 'n_intervals', 1)],
+            [('app-state', 'data', state), ('trade-history-store', 'data', history)]
+        )
+        assert _updated(response) == {}, "Should send no update for an unchanged state"
+        
+        # A new trade is appended to the browser's copy
+        _add_trade(bot, -50.0, 2)
+        response = _updated(_dash_update(
+            client, self.APP_STATE_OUTPUTS,
+            [('interval-component', 'n_intervals', 2)],
+            [('app-state', 'data', state), ('trade-history-store', 'data', history)]
+        ))
+        assert 'app-state' not in response, "Should leave the unchanged state alone"
+        patch = response['trade-history-store']['data']
+        assert patch['__dash_patch_update'], "Should patch the history store"
+        assert patch['operations'][0]['operation'] == 'Extend', "Should extend the stored history"
+        assert patch['operations'][0]['params']['value'] == [{'timestamp': '2025-01-02T00:00:00', 'pnl': -50.0}], \
+            "Should send only the new trade"
+        
+        # The browser holds more trades than the bot, e.g. after a restart
+        bot.trade_history[:] = bot.trade_history[:1]
+        stale_history = history + [{'timestamp': '2025-01-02T00:00:00', 'pnl': -50.0},
+                                   {'timestamp': '2025-01-03T00:00:00', 'pnl': 25.0}]
+        response = _updated(_dash_update(
+            client, self.APP_STATE_OUTPUTS,
+            [('interval-component', 'n_intervals', 3)],
+            [('app-state', 'data', state), ('trade-history-store', 'data', stale_history)]
+        ))
+        assert response['trade-history-store']['data'] == history, "Should replace the store with the full history"
+    
+    def test_settings_tabs_load_once(self):
+        """Test that settings tabs are built on first activation only"""
+        client = create_dashboard(_DashboardBot()).server.test_client()
+        outputs = [(f"{tab_id}-content", 'children') for tab_id in ('api-settings', 'backup-restore', 'about')]
+        
+        response = _dash_update(
+            client, outputs,
+            [('settings-tabs', 'active_tab', 'about')],
+            [(component_id, prop, None) for component_id, prop in outputs]
+        ).get_json()['response']
+        assert list(response) == ['about-content'], "Should build only the active tab"
+        
+        response = _dash_update(
+            client, outputs,
+            [('settings-tabs', 'active_tab', 'about')],
+            [(component_id, prop, [] if component_id != 'about-content' else {'loaded': True})
+             for component_id, prop in outputs]
+        )
+        assert _updated(response) == {}, "Should not rebuild a loaded tab"
+
 class TestIntegration:
     """Integration tests"""
     